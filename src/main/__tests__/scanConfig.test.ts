@@ -12,6 +12,8 @@ import { describe, it, expect } from 'vitest';
 import {
     shouldExcludeByName,
     shouldExcludeByPath,
+    shouldExcludeByNormalizedPath,
+    normalizeExclusions,
     isSupportedFileType,
     getFileKindFromExtension,
     UNIVERSAL_DIR_EXCLUSIONS,
@@ -73,6 +75,14 @@ describe('Exclusion Matching', () => {
             expect(shouldExcludeByPath('C:\\Windows\\System32', winExclusions)).toBe(true);
             expect(shouldExcludeByPath('C:\\Users\\Test', winExclusions)).toBe(false);
         });
+
+        it('should match pre-normalized exclusions the same way', () => {
+            const normalized = normalizeExclusions(['/System', 'C:\\Windows']);
+            expect(normalized).toEqual(['/system', 'c:/windows']);
+            expect(shouldExcludeByNormalizedPath('/SYSTEM/Library', normalized)).toBe(true);
+            expect(shouldExcludeByNormalizedPath('C:\\Windows\\Temp', normalized)).toBe(true);
+            expect(shouldExcludeByNormalizedPath('/Users/test/Documents', normalized)).toBe(false);
+        });
     });
 
     describe('UNIVERSAL_DIR_EXCLUSIONS', () => {
@@ -203,6 +213,13 @@ describe('File Type Classification', () => {
             expect(map.has('pdf')).toBe(true);
             expect(map.get('pdf')).toBe('document');
         });
+
+        it('should return a copy that does not affect lookups', () => {
+            const map = getExtensionToKindMap();
+            map.delete('pdf');
+            expect(isSupportedFileType('pdf')).toBe(true);
+            expect(getExtensionToKindMap().has('pdf')).toBe(true);
+        });
     });
 });
 
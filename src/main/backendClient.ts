@@ -44,6 +44,14 @@ export interface FailedFile {
 
 const API_BASE_URL = process.env.LOCAL_RAG_API_URL ?? 'http://127.0.0.1:8890';
 
+// Carries the HTTP status so callers can branch on it instead of parsing the message
+export class BackendResponseError extends Error {
+    constructor(readonly status: number, body: string) {
+        super(`Backend responded with ${status}${body ? `: ${body}` : ''}`);
+        this.name = 'BackendResponseError';
+    }
+}
+
 export type IndexOperationMode = 'rescan' | 'reindex';
 export type IndexOperationScope = 'global' | 'folder' | 'email' | 'notes';
 
@@ -129,7 +137,7 @@ async function requestJson<T>(endpoint: string, init?: RequestInit): Promise<T>
 
         if (!response.ok) {
             const text = await response.text().catch(() => '');
-            throw new Error(`Backend responded with ${response.status}${text ? `: ${text}` : ''}`);
+            throw new BackendResponseError(response.status, text);
         }
 
         if (response.status === 204) {
@@ -161,7 +169,7 @@ async function requestBinary(endpoint: string, init?: RequestInit): Promise<Uint
         });
         if (!response.ok) {
             const text = await response.text().catch(() => '');
-            throw new Error(`Backend responded with ${response.status}${text ? `: ${text}` : ''}`);
+            throw new BackendResponseError(response.status, text);
         }
         const buffer = (await response.arrayBuffer()) as any;
         return new Uint8Array(buffer);
@@ -179,11 +187,17 @@ function mapAgentStepFile(payload: any): AgentStepFile {
     };
 }
 
+// Fallback ids for steps the backend sent without one. The counter restarts on every
+// launch, so a random tag drawn once per launch keeps these ids distinct from ones
+// minted by earlier launches (e.g. in a saved session).
+const anonymousStepPrefix = `step-local-${Math.random().toString(16).slice(2, 10)}`;
+let anonymousStepCounter = 0;
+
 function mapAgentStep(payload: any): AgentStep {
     const files = Array.isArray(payload.files) ? payload.files.map(mapAgentStepFile) : [];
-    const fallbackId = `step-${Date.now()}-${Math.random().toString(16).slice(2)}`;
+    const rawId = payload.id ?? payload.step_id;
     return {
-        id: String(payload.id ?? payload.step_id ?? fallbackId),
+        id: rawId != null ? String(rawId) : `${anonymousStepPrefix}-${++anonymousStepCounter}`,
         title: payload.title ?? 'Step',
         detail: payload.detail ?? null,
         status: payload.status ?? 'complete',
@@ -486,43 +500,58 @@ function mapChatSession(payload: any): ChatSession {
     };
 }
 
-export async function updateSettings(settings: {
-    vision_max_pixels?: number;
-    search_result_limit?: number;
-    qa_context_limit?: number;
-    max_snippet_length?: number;
-    summary_max_tokens?: number;
-    embed_batch_size?: number;
-    embed_batch_delay_ms?: number;
-    vision_batch_delay_ms?: number;
-    pdf_one_chunk_per_page?: boolean;
-}): Promise<void> {
+export async function updateSettings(settings: Partial<BackendSettings>): Promise<void> {
     await requestJson('/settings/', {
         method: 'PATCH',
         body: JSON.stringify(settings)
     });
 }
 
-export async function getHealth(): Promise<HealthStatus> {
-    const controller = new AbortController();
-    const timeoutId = setTimeout(() => controller.abort(), 30000); // 30s timeout
+const HEALTH_TIMEOUT_MS = 30000;
+// Kept below the 2s startup poll interval so backend readiness is still picked up on the next tick
+const HEALTH_FAILURE_TTL_MS = 1000;
+
+// Every window (and every useWorkspaceData consumer) polls health on its own timer.
+// Concurrent callers share the probe that is already in flight instead of each
+// issuing their own request.
+let healthInFlight: Promise<HealthStatus> | null = null;
+// Last "unreachable" result, replayed for a short window so a down backend
+// isn't re-probed (and its timeout re-paid) by every poller in turn.
+let healthFailure: { status: HealthStatus; at: number } | null = null;
+
+export function getHealth(): Promise<HealthStatus> {
+    if (healthFailure && performance.now() - healthFailure.at < HEALTH_FAILURE_TTL_MS) {
+        return Promise.resolve(healthFailure.status);
+    }
+    if (!healthInFlight) {
+        healthInFlight = probeHealth().finally(() => {
+            healthInFlight = null;
+        });
+    }
+    return healthInFlight;
+}
+
+// fetch() shares undici's global keep-alive pool, so health polls reuse the same
+// socket to the backend; only the abort signal is created per probe.
+async function probeHealth(): Promise<HealthStatus> {
     try {
         const data = await requestJson('/health', {
             method: 'GET',
-            signal: controller.signal as any // Cast to any because Electron types might mismatch
+            signal: AbortSignal.timeout(HEALTH_TIMEOUT_MS) as any // Cast to any because Electron types might mismatch
         });
-        clearTimeout(timeoutId);
+        healthFailure = null;
         return mapHealth(data);
     } catch (error) {
-        clearTimeout(timeoutId);
         console.warn('Health check failed or timed out:', error);
         // Return offline status instead of throwing to prevent blocking other calls
-        return {
+        const status: HealthStatus = {
             status: 'degraded',
             indexedFiles: 0,
             watchedFolders: 0,
             message: 'Backend unreachable'
         };
+        healthFailure = { status, at: performance.now() };
+        return status;
     }
 }
 
@@ -551,6 +580,7 @@ export async function addFolder(pathValue: string, label?: string, scanMode?: 'f
 
 export async function removeFolder(folderId: string): Promise<void> {
     await requestJson(`/folders/${encodeURIComponent(folderId)}`, { method: 'DELETE' });
+    clearPageImageCache();
 }
 
 export async function runIndex(options?: IndexOperationOptions): Promise<IndexProgressUpdate> {
@@ -588,6 +618,8 @@ export async function runIndex(options?: IndexOperationOptions): Promise<IndexPr
         method: 'POST',
         body: JSON.stringify(payload)
     });
+    // Re-indexing can re-render pages and re-issue chunk ids.
+    clearPageImageCache();
     return mapProgress(data);
 }
 
@@ -785,6 +817,7 @@ export async function runStagedIndex(options?: {
         method: 'POST',
         body: JSON.stringify(payload)
     });
+    clearPageImageCache();
     return mapProgress(data);
 }
 
@@ -870,6 +903,7 @@ export async function getFileById(fileId: string): Promise<FileRecord | null> {
 
 export async function deleteIndexedFile(fileId: string): Promise<void> {
     await requestJson(`/files/${encodeURIComponent(fileId)}`, { method: 'DELETE' });
+    clearPageImageCache();
 }
 
 // Plugin API prefixes
@@ -1069,7 +1103,9 @@ export async function askWorkspaceStream(
     if (limit !== undefined) {
         payload.limit = limit;
     }
-    console.log('[backendClient] askWorkspaceStream payload:', JSON.stringify(payload));
+    // Serialize once; the same string is logged and sent
+    const body = JSON.stringify(payload);
+    console.log('[backendClient] askWorkspaceStream payload:', body);
     try {
         const headers: Record<string, string> = { 'Content-Type': 'application/json' };
         const key = getLocalKey();
@@ -1080,7 +1116,7 @@ export async function askWorkspaceStream(
         const response = await fetch(resolveEndpoint('/qa/stream'), {
             method: 'POST',
             headers,
-            body: JSON.stringify(payload)
+            body
         });
 
         if (!response.ok) {
@@ -1174,20 +1210,65 @@ export async function ingestScreenshot(imageBytes: Uint8Array): Promise<Activity
     return (await response.json()) as ActivityLog;
 }
 
+// Rendered page images are expensive for the backend to rasterize and the
+// viewer requests the same pages repeatedly while paging back and forth.
+// Each entry is a full base64 PNG, so keep only a few pages around.
+const PAGE_IMAGE_CACHE_LIMIT = 8;
+// Entries hold the pending promise so a prefetch and a real request for the
+// same page share one render.
+const pageImageCache = new Map<string, Promise<string>>();
+
+function cachedPageImage(key: string, load: () => Promise<string>): Promise<string> {
+    const cached = pageImageCache.get(key);
+    if (cached !== undefined) {
+        // Re-insert so the entry becomes the most recently used.
+        pageImageCache.delete(key);
+        pageImageCache.set(key, cached);
+        return cached;
+    }
+    const pending = load();
+    pageImageCache.set(key, pending);
+    pending.catch(() => {
+        if (pageImageCache.get(key) === pending) {
+            pageImageCache.delete(key);
+        }
+    });
+    if (pageImageCache.size > PAGE_IMAGE_CACHE_LIMIT) {
+        const oldest = pageImageCache.keys().next().value;
+        if (oldest !== undefined) {
+            pageImageCache.delete(oldest);
+        }
+    }
+    return pending;
+}
+
+// Electron main process has Node Buffer. Wrap the existing memory rather than
+// Buffer.from(bytes), which would copy the whole image first.
+function bytesToBase64(bytes: Uint8Array): string {
+    return Buffer.from(bytes.buffer, bytes.byteOffset, bytes.byteLength).toString('base64');
+}
+
+function clearPageImageCache(): void {
+    pageImageCache.clear();
+}
+
 export async function getChunkHighlightPngBase64(chunkId: string, zoom: number = 2.0): Promise<string> {
     if (!chunkId) {
         throw new Error('Missing chunk id.');
     }
     const params = new URLSearchParams();
     params.set('zoom', String(zoom));
+    // Not cached: chunk ids carry no file version, so a cached highlight could
+    // outlive a reindex the client never hears about.
     const bytes = await requestBinary(`/files/chunks/${encodeURIComponent(chunkId)}/highlight.png?${params.toString()}`, {
         method: 'GET'
     });
-    // Electron main process has Node Buffer.
-    return Buffer.from(bytes).toString('base64');
+    return bytesToBase64(bytes);
 }
 
-export async function getPdfPageImageBase64(fileId: string, pageNumber: number, zoom: number = 2.0): Promise<string> {
+// version identifies the file revision (its modified time), so an edited file
+// never gets pages rendered from its previous contents.
+export async function getPdfPageImageBase64(fileId: string, pageNumber: number, zoom: number = 2.0, version?: string): Promise<string> {
     if (!fileId) {
         throw new Error('Missing file id.');
     }
@@ -1197,8 +1278,16 @@ export async function getPdfPageImageBase64(fileId: string, pageNumber: number,
     const params = new URLSearchParams();
     params.set('zoom', String(zoom));
     const endpoint = `/files/${encodeURIComponent(fileId)}/pages/${pageNumber}/image.png?${params.toString()}`;
-    const bytes = await requestBinary(endpoint, { method: 'GET' });
-    return Buffer.from(bytes).toString('base64');
+    return cachedPageImage(`page:${fileId}:${version ?? ''}:${pageNumber}:${zoom}`, async () => {
+        const bytes = await requestBinary(endpoint, { method: 'GET' });
+        return bytesToBase64(bytes);
+    });
+}
+
+// Render a page into the cache without returning it, so the viewer can warm
+// neighbouring pages without shipping their images over IPC.
+export async function prefetchPdfPageImage(fileId: string, pageNumber: number, zoom: number = 2.0, version?: string): Promise<void> {
+    await getPdfPageImageBase64(fileId, pageNumber, zoom, version);
 }
 
 export async function getActivityTimeline(start?: string, end?: string, summary: boolean = false): Promise<ActivityTimelineResponse> {
@@ -1480,7 +1569,7 @@ export async function getCachedBasicProfile(userId: string): Promise<BasicProfil
         return data;
     } catch (error) {
         // 404 means no cached profile
-        if (error instanceof Error && error.message.includes('404')) {
+        if (error instanceof BackendResponseError && error.status === 404) {
             return null;
         }
         throw error;
@@ -21,6 +21,7 @@ import {
     listChunksForFile,
     getChunkHighlightPngBase64,
     getPdfPageImageBase64,
+    prefetchPdfPageImage,
     // Staged indexing
     getStageProgress,
     getErrorFiles,
@@ -43,7 +44,7 @@ import {
 } from '../backendClient';
 import { WindowManager } from '../windowManager';
 
-const ALLOWED_IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg', '.ico'];
+const ALLOWED_IMAGE_EXTENSIONS = new Set(['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.svg', '.ico']);
 
 async function isPathInIndexedFolders(targetPath: string): Promise<boolean> {
     try {
@@ -157,7 +158,7 @@ export function registerFileHandlers(windowManager: WindowManager) {
         return getChunkHighlightPngBase64(chunkId, zoom);
     });
 
-    ipcMain.handle('files:pdf-page-image', async (_event, payload: { fileId: string; pageNumber: number; zoom?: number }) => {
+    ipcMain.handle('files:pdf-page-image', async (_event, payload: { fileId: string; pageNumber: number; zoom?: number; version?: string }) => {
         const fileId = payload?.fileId;
         if (!fileId) {
             throw new Error('Missing file id.');
@@ -167,7 +168,20 @@ export function registerFileHandlers(windowManager: WindowManager) {
             throw new Error('Invalid page number.');
         }
         const zoom = typeof payload?.zoom === 'number' ? payload.zoom : 2.0;
-        return getPdfPageImageBase64(fileId, pageNumber, zoom);
+        const version = typeof payload?.version === 'string' ? payload.version : undefined;
+        return getPdfPageImageBase64(fileId, pageNumber, zoom, version);
+    });
+
+    ipcMain.handle('files:pdf-prefetch-page', async (_event, payload: { fileId: string; pageNumber: number; zoom?: number; version?: string }) => {
+        const fileId = payload?.fileId;
+        const pageNumber = payload?.pageNumber;
+        if (!fileId || typeof pageNumber !== 'number' || pageNumber < 1) {
+            return;
+        }
+        const zoom = typeof payload?.zoom === 'number' ? payload.zoom : 2.0;
+        const version = typeof payload?.version === 'string' ? payload.version : undefined;
+        // Warming is best effort; the real request reports any error
+        await prefetchPdfPageImage(fileId, pageNumber, zoom, version).catch(() => undefined);
     });
 
     ipcMain.handle('files:open', async (_event, payload: { path: string }) => {
@@ -213,7 +227,7 @@ export function registerFileHandlers(windowManager: WindowManager) {
         }
 
         const ext = path.extname(payload.filePath).toLowerCase();
-        if (!ALLOWED_IMAGE_EXTENSIONS.includes(ext)) {
+        if (!ALLOWED_IMAGE_EXTENSIONS.has(ext)) {
             throw new Error(`Access denied: file type "${ext}" is not an allowed image format.`);
         }
 
@@ -2,7 +2,7 @@ import { ipcMain } from 'electron';
 import { ModelManager } from '../modelManager';
 import { ServiceManager } from '../serviceManager';
 import { updateLogSettings } from '../logger';
-import { updateSettings, stopPythonModel, updateVLMConfig, updateEmbeddingConfig, updateRerankerConfig, updateWhisperConfig } from '../backendClient';
+import { updateSettings, stopPythonModel, updateVLMConfig, updateEmbeddingConfig, updateRerankerConfig, updateWhisperConfig, type BackendSettings } from '../backendClient';
 
 export function registerModelHandlers(modelManager: ModelManager, serviceManager: ServiceManager) {
     ipcMain.handle('models:status', async () => modelManager.getStatus());
@@ -16,7 +16,7 @@ export function registerModelHandlers(modelManager: ModelManager, serviceManager
         const newConfig = await modelManager.getConfig();
 
         // Update Python backend settings if relevant fields changed
-        const settingsToUpdate: any = {};
+        const settingsToUpdate: Partial<BackendSettings> = {};
         if (oldConfig.visionMaxPixels !== newConfig.visionMaxPixels) {
             settingsToUpdate.vision_max_pixels = newConfig.visionMaxPixels;
         }
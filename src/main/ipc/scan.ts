@@ -18,7 +18,8 @@ import {
     getSmartRecommendedDirectories,
     getSystemExclusions,
     shouldExcludeByName,
-    shouldExcludeByPath,
+    normalizeExclusions,
+    shouldExcludeByNormalizedPath,
     isSupportedFileType,
     getFileKindFromExtension,
     detectFileOrigin,
@@ -32,12 +33,16 @@ import { WindowManager } from '../windowManager';
 // Active scan state
 let activeScanAbortController: AbortController | null = null;
 
+// Upper bound on concurrent file stats within one directory
+const FILE_STAT_CONCURRENCY = 16;
+
 interface ScanContext {
     event: IpcMainEvent;
     options: ScanOptions;
     cutoffDate: Date | null; // For "newer than" filtering
     dateFrom: Date | null; // For range filtering (start)
     dateTo: Date | null; // For range filtering (end)
+    // Both lists are pre-normalized with normalizeExclusions
     systemExclusions: string[];
     customExclusions: string[];
 
@@ -54,30 +59,31 @@ interface ScanContext {
     batchBuffer: ScannedFile[];
     lastBatchTime: number;
     lastProgressTime: number;
+    startedAt: string;
 }
 
+const STAGE_LABELS: Record<ScanStage, string> = {
+    idle: 'Ready',
+    planning: 'Scanning...', // Not used, but kept for type safety
+    scanning: 'Scanning...',
+    building: 'Scanning...', // Not used, but kept for type safety
+    completed: 'Complete',
+    cancelled: 'Cancelled',
+    error: 'Failed',
+};
+
 // Send progress update
 function sendProgress(ctx: ScanContext, stage: ScanStage, currentPath?: string) {
     if (ctx.event.sender.isDestroyed()) return;
 
-    const stageLabels: Record<ScanStage, string> = {
-        idle: 'Ready',
-        planning: 'Scanning...', // Not used, but kept for type safety
-        scanning: 'Scanning...',
-        building: 'Scanning...', // Not used, but kept for type safety
-        completed: 'Complete',
-        cancelled: 'Cancelled',
-        error: 'Failed',
-    };
-
     const progress: ScanProgress = {
         status: stage,
-        stage: stageLabels[stage],
+        stage: STAGE_LABELS[stage],
         currentPath,
         scannedCount: ctx.scannedCount,
         matchedCount: ctx.matchedCount,
         skippedCount: ctx.skippedCount,
-        startedAt: new Date().toISOString(),
+        startedAt: ctx.startedAt,
     };
 
     ctx.event.sender.send('scan:progress', progress);
@@ -91,18 +97,103 @@ function shouldExclude(fullPath: string, dirName: string, ctx: ScanContext): boo
     }
 
     // Check system exclusions
-    if (ctx.options.useRecommendedExclusions && shouldExcludeByPath(fullPath, ctx.systemExclusions)) {
+    if (ctx.options.useRecommendedExclusions && shouldExcludeByNormalizedPath(fullPath, ctx.systemExclusions)) {
         return true;
     }
 
     // Check custom exclusions
-    if (ctx.customExclusions.length > 0 && shouldExcludeByPath(fullPath, ctx.customExclusions)) {
+    if (ctx.customExclusions.length > 0 && shouldExcludeByNormalizedPath(fullPath, ctx.customExclusions)) {
         return true;
     }
 
     return false;
 }
 
+// Stat and filter a single file; resolves once the file has been recorded or skipped
+async function scanFile(fullPath: string, name: string, extension: string, dirPath: string, ctx: ScanContext): Promise<void> {
+    // Get file stats with timeout to avoid hanging on slow files
+    let stats;
+    try {
+        stats = await Promise.race([
+            fs.promises.stat(fullPath),
+            new Promise<never>((_, reject) =>
+                setTimeout(() => reject(new Error('stat timeout')), 1000)
+            )
+        ]);
+    } catch (statErr) {
+        // Skip files that timeout or fail to stat
+        ctx.skippedCount++;
+        return;
+    }
+
+    if (ctx.aborted) return;
+
+    const modifiedAt = stats.mtime;
+
+    // Check time range filter
+    // If dateFrom and dateTo are set, use range filtering (for year-based or custom ranges)
+    if (ctx.dateFrom && ctx.dateTo) {
+        if (modifiedAt < ctx.dateFrom || modifiedAt > ctx.dateTo) {
+            ctx.skippedCount++;
+            return;
+        }
+    } else if (ctx.cutoffDate && modifiedAt < ctx.cutoffDate) {
+        // Fallback to cutoff date for relative ranges
+        ctx.skippedCount++;
+        return;
+    }
+
+    // Get file kind
+    const kind = getFileKindFromExtension(extension) || 'other';
+
+    // Detect origin
+    const origin = detectFileOrigin(fullPath);
+
+    const scannedFile: ScannedFile = {
+        path: fullPath,
+        name,
+        extension,
+        size: stats.size,
+        modifiedAt: modifiedAt.toISOString(),
+        createdAt: stats.birthtime.toISOString(),
+        kind,
+        origin,
+        parentPath: dirPath,
+    };
+
+    ctx.files.push(scannedFile);
+    ctx.matchedCount++;
+    ctx.batchBuffer.push(scannedFile);
+
+    // Send updates in batches (every 100ms or 50 files)
+    const currentTime = Date.now();
+    if (ctx.batchBuffer.length >= 50 || currentTime - ctx.lastBatchTime > 100) {
+        if (!ctx.event.sender.isDestroyed()) {
+            ctx.event.sender.send('scan:files', ctx.batchBuffer);
+        }
+        ctx.batchBuffer = [];
+        ctx.lastBatchTime = currentTime;
+    }
+}
+
+// Run scanFile over a directory's files with at most FILE_STAT_CONCURRENCY stats in flight
+async function scanFiles(files: Array<{ fullPath: string; name: string; extension: string }>, dirPath: string, ctx: ScanContext): Promise<void> {
+    let next = 0;
+    const worker = async () => {
+        while (next < files.length && !ctx.aborted) {
+            const file = files[next++];
+            try {
+                await scanFile(file.fullPath, file.name, file.extension, dirPath, ctx);
+            } catch (err) {
+                // Skip files we can't access
+                ctx.skippedCount++;
+            }
+        }
+    };
+    const workerCount = Math.min(FILE_STAT_CONCURRENCY, files.length);
+    await Promise.all(Array.from({ length: workerCount }, worker));
+}
+
 // Scan a single directory recursively
 async function scanDirectory(dirPath: string, ctx: ScanContext): Promise<void> {
     if (ctx.aborted) return;
@@ -132,9 +223,11 @@ async function scanDirectory(dirPath: string, ctx: ScanContext): Promise<void> {
 
         if (ctx.aborted) return;
 
-        for (const entry of entries) {
-            if (ctx.aborted) return;
+        // Files are stat'ed concurrently; subdirectories are walked afterwards, one at a time
+        const files: Array<{ fullPath: string; name: string; extension: string }> = [];
+        const subdirectories: Array<{ fullPath: string; name: string }> = [];
 
+        for (const entry of entries) {
             const fullPath = path.join(dirPath, entry.name);
 
             // Skip hidden files/directories
@@ -143,136 +236,84 @@ async function scanDirectory(dirPath: string, ctx: ScanContext): Promise<void> {
                 continue;
             }
 
-            try {
-                if (entry.isDirectory()) {
-                    // Check if directory should be excluded
-                    if (shouldExclude(fullPath, entry.name, ctx)) {
-                        ctx.skippedCount++;
-                        continue;
-                    }
+            if (entry.isDirectory()) {
+                subdirectories.push({ fullPath, name: entry.name });
+            } else if (entry.isFile()) {
+                ctx.scannedCount++;
 
-                    // OPTIMIZATION: Check directory mtime before recursing
-                    // If directory hasn't been modified since the time range, skip it entirely
-                    // Note: This is a heuristic - directory mtime updates when files are
-                    // created/deleted/renamed inside, but NOT when file contents change.
-                    // However, this is still a huge optimization for large directories.
-                    try {
-                        const dirStats = await Promise.race([
-                            fs.promises.stat(fullPath),
-                            new Promise<never>((_, reject) =>
-                                setTimeout(() => reject(new Error('dir stat timeout')), 500)
-                            )
-                        ]);
-
-                        let shouldSkipDir = false;
-
-                        // For year-based or custom date ranges (dateFrom/dateTo)
-                        if (ctx.dateFrom && ctx.dateTo) {
-                            // If directory was last modified BEFORE dateFrom, skip it
-                            // (no files inside could have been modified within the range)
-                            if (dirStats.mtime < ctx.dateFrom) {
-                                shouldSkipDir = true;
-                            }
-                        } else if (ctx.cutoffDate) {
-                            // For relative time ranges (Last Week, Last Month, etc.)
-                            if (dirStats.mtime < ctx.cutoffDate) {
-                                shouldSkipDir = true;
-                            }
-                        }
+                // Send progress updates periodically with file path (not just directory)
+                const currentTime = Date.now();
+                if (currentTime - ctx.lastProgressTime > 200) {
+                    sendProgress(ctx, 'scanning', fullPath);
+                    ctx.lastProgressTime = currentTime;
+                }
 
-                        if (shouldSkipDir) {
-                            ctx.skippedCount++;
-                            continue;
-                        }
-                    } catch {
-                        // If we can't stat the directory, continue with scanning
-                    }
+                // Get file extension
+                const extension = path.extname(entry.name).slice(1).toLowerCase();
 
-                    // Recursively scan subdirectory
-                    await scanDirectory(fullPath, ctx);
+                // Check if this is a supported file type (Code excluded)
+                if (!isSupportedFileType(extension)) {
+                    ctx.skippedCount++;
+                    continue;
+                }
 
-                } else if (entry.isFile()) {
-                    ctx.scannedCount++;
+                files.push({ fullPath, name: entry.name, extension });
+            }
+        }
 
-                    // Send progress updates periodically with file path (not just directory)
-                    const currentTime = Date.now();
-                    if (currentTime - ctx.lastProgressTime > 200) {
-                        sendProgress(ctx, 'scanning', fullPath);
-                        ctx.lastProgressTime = currentTime;
-                    }
+        await scanFiles(files, dirPath, ctx);
 
-                    // Get file extension
-                    const extension = path.extname(entry.name).slice(1).toLowerCase();
+        for (const { fullPath, name } of subdirectories) {
+            if (ctx.aborted) return;
 
-                    // Check if this is a supported file type (Code excluded)
-                    if (!isSupportedFileType(extension)) {
-                        ctx.skippedCount++;
-                        continue;
-                    }
+            try {
+                // Check if directory should be excluded
+                if (shouldExclude(fullPath, name, ctx)) {
+                    ctx.skippedCount++;
+                    continue;
+                }
 
-                    // Get file stats with timeout to avoid hanging on slow files
-                    let stats;
-                    try {
-                        stats = await Promise.race([
-                            fs.promises.stat(fullPath),
-                            new Promise<never>((_, reject) =>
-                                setTimeout(() => reject(new Error('stat timeout')), 1000)
-                            )
-                        ]);
-                    } catch (statErr) {
-                        // Skip files that timeout or fail to stat
-                        ctx.skippedCount++;
-                        continue;
-                    }
+                // OPTIMIZATION: Check directory mtime before recursing
+                // If directory hasn't been modified since the time range, skip it entirely
+                // Note: This is a heuristic - directory mtime updates when files are
+                // created/deleted/renamed inside, but NOT when file contents change.
+                // However, this is still a huge optimization for large directories.
+                try {
+                    const dirStats = await Promise.race([
+                        fs.promises.stat(fullPath),
+                        new Promise<never>((_, reject) =>
+                            setTimeout(() => reject(new Error('dir stat timeout')), 500)
+                        )
+                    ]);
 
-                    const modifiedAt = stats.mtime;
+                    let shouldSkipDir = false;
 
-                    // Check time range filter
-                    // If dateFrom and dateTo are set, use range filtering (for year-based or custom ranges)
+                    // For year-based or custom date ranges (dateFrom/dateTo)
                     if (ctx.dateFrom && ctx.dateTo) {
-                        if (modifiedAt < ctx.dateFrom || modifiedAt > ctx.dateTo) {
-                            ctx.skippedCount++;
-                            continue;
+                        // If directory was last modified BEFORE dateFrom, skip it
+                        // (no files inside could have been modified within the range)
+                        if (dirStats.mtime < ctx.dateFrom) {
+                            shouldSkipDir = true;
+                        }
+                    } else if (ctx.cutoffDate) {
+                        // For relative time ranges (Last Week, Last Month, etc.)
+                        if (dirStats.mtime < ctx.cutoffDate) {
+                            shouldSkipDir = true;
                         }
-                    } else if (ctx.cutoffDate && modifiedAt < ctx.cutoffDate) {
-                        // Fallback to cutoff date for relative ranges
-                        ctx.skippedCount++;
-                        continue;
                     }
 
-                    // Get file kind
-                    const kind = getFileKindFromExtension(extension) || 'other';
-
-                    // Detect origin
-                    const origin = detectFileOrigin(fullPath);
-
-                    const scannedFile: ScannedFile = {
-                        path: fullPath,
-                        name: entry.name,
-                        extension,
-                        size: stats.size,
-                        modifiedAt: modifiedAt.toISOString(),
-                        createdAt: stats.birthtime.toISOString(),
-                        kind,
-                        origin,
-                        parentPath: dirPath,
-                    };
-
-                    ctx.files.push(scannedFile);
-                    ctx.matchedCount++;
-                    ctx.batchBuffer.push(scannedFile);
-
-                    // Send updates in batches (every 100ms or 50 files)
-                    if (ctx.batchBuffer.length >= 50 || currentTime - ctx.lastBatchTime > 100) {
-                        if (!ctx.event.sender.isDestroyed()) {
-                            ctx.event.sender.send('scan:files', ctx.batchBuffer);
-                        }
-                        ctx.batchBuffer = [];
-                        ctx.lastBatchTime = currentTime;
+                    if (shouldSkipDir) {
+                        ctx.skippedCount++;
+                        continue;
                     }
+                } catch {
+                    // If we can't stat the directory, continue with scanning
                 }
+
+                // Recursively scan subdirectory
+                await scanDirectory(fullPath, ctx);
             } catch (err) {
-                // Skip files/dirs we can't access
+                // Skip dirs we can't access
                 ctx.skippedCount++;
             }
         }
@@ -282,6 +323,39 @@ async function scanDirectory(dirPath: string, ctx: ScanContext): Promise<void> {
     }
 }
 
+// Drop duplicate roots and roots nested inside another selected root, so
+// overlapping selections don't walk (and report) the same files twice.
+// macOS and Windows filesystems are case-insensitive, so compare with a
+// lower-cased key there while walking the path as given.
+function collapseNestedDirectories(directories: string[]): string[] {
+    const caseInsensitive = process.platform === 'darwin' || process.platform === 'win32';
+    const toKey = (dir: string) => (caseInsensitive ? dir.toLowerCase() : dir);
+
+    const byKey = new Map<string, string>();
+    for (const dir of directories) {
+        const resolved = path.resolve(dir);
+        const key = toKey(resolved);
+        if (!byKey.has(key)) {
+            byKey.set(key, resolved);
+        }
+    }
+
+    const sorted = Array.from(byKey.entries()).sort(([a], [b]) => a.length - b.length);
+    const rootKeys: string[] = [];
+    const roots: string[] = [];
+    for (const [key, dir] of sorted) {
+        const isNested = rootKeys.some(rootKey => {
+            const prefix = rootKey.endsWith(path.sep) ? rootKey : rootKey + path.sep;
+            return key.startsWith(prefix);
+        });
+        if (!isNested) {
+            rootKeys.push(key);
+            roots.push(dir);
+        }
+    }
+    return roots;
+}
+
 // Build folder tree from scanned files with pruning
 function buildFolderTree(files: ScannedFile[], rootPaths: string[], filterKind?: FileKind): FolderNode[] {
     // Group files by their parent paths
@@ -313,22 +387,29 @@ function buildFolderTree(files: ScannedFile[], rootPaths: string[], filterKind?:
     return trees;
 }
 
+// ISO-8601 timestamps order correctly as plain strings, so skip the
+// collation work localeCompare does on every comparison.
+function compareIsoDesc(a: string, b: string): number {
+    return a < b ? 1 : a > b ? -1 : 0;
+}
+
 function buildFolderNodeRecursive(
     dirPath: string,
     filesByPath: Map<string, ScannedFile[]>
 ): FolderNode | null {
     const directFiles = filesByPath.get(dirPath) || [];
 
-    // Find all subdirectories that have files
-    const childPaths: string[] = [];
+    // Find all subdirectories that have files (Set keeps first-seen order)
+    const childPaths = new Set<string>();
+    const prefix = dirPath + path.sep;
     for (const [filePath] of filesByPath) {
-        if (filePath.startsWith(dirPath + path.sep) && filePath !== dirPath) {
+        if (filePath.startsWith(prefix) && filePath !== dirPath) {
             // Get immediate child directory
-            const relativePath = filePath.slice(dirPath.length + 1);
+            const relativePath = filePath.slice(prefix.length);
             const firstPart = relativePath.split(path.sep)[0];
             const childPath = path.join(dirPath, firstPart);
-            if (!childPaths.includes(childPath) && childPath !== dirPath) {
-                childPaths.push(childPath);
+            if (childPath !== dirPath) {
+                childPaths.add(childPath);
             }
         }
     }
@@ -369,8 +450,8 @@ function buildFolderNodeRecursive(
         totalFileCount,
         totalSize,
         latestModified,
-        children: children.sort((a, b) => b.latestModified.localeCompare(a.latestModified)),
-        files: directFiles.sort((a, b) => b.modifiedAt.localeCompare(a.modifiedAt)),
+        children: children.sort((a, b) => compareIsoDesc(a.latestModified, b.latestModified)),
+        files: directFiles.sort((a, b) => compareIsoDesc(a.modifiedAt, b.modifiedAt)),
     };
 }
 
@@ -390,13 +471,13 @@ export function registerScanHandlers(windowManager?: WindowManager) {
 
     // Load saved settings
     ipcMain.handle('scan:get-settings', async () => {
-        const settings = loadScanSettings();
+        const settings = await loadScanSettings();
         return settings || getDefaultScanSettings();
     });
 
     // Save settings
     ipcMain.handle('scan:save-settings', async (_event, settings: ScanSettings) => {
-        saveScanSettings(settings);
+        await saveScanSettings(settings);
         return { success: true };
     });
 
@@ -438,11 +519,12 @@ export function registerScanHandlers(windowManager?: WindowManager) {
         activeScanAbortController = new AbortController();
         const abortController = activeScanAbortController;
 
+        const now = Date.now();
         const daysBack = payload?.daysBack ?? null;
-        const cutoffDate = daysBack ? new Date(Date.now() - daysBack * 24 * 60 * 60 * 1000) : null;
+        const cutoffDate = daysBack ? new Date(now - daysBack * 24 * 60 * 60 * 1000) : null;
         const dateFrom = payload?.dateFrom ? new Date(payload.dateFrom) : null;
         const dateTo = payload?.dateTo ? new Date(payload.dateTo) : null;
-        const directories = payload?.directories || [];
+        const directories = collapseNestedDirectories(payload?.directories || []);
 
         if (directories.length === 0) {
             event.sender.send('scan:error', 'No directories selected for scanning');
@@ -455,16 +537,17 @@ export function registerScanHandlers(windowManager?: WindowManager) {
             cutoffDate,
             dateFrom,
             dateTo,
-            systemExclusions: getSystemExclusions(),
-            customExclusions: payload.customExclusions || [],
+            systemExclusions: normalizeExclusions(getSystemExclusions()),
+            customExclusions: normalizeExclusions(payload.customExclusions || []),
             scannedCount: 0,
             matchedCount: 0,
             skippedCount: 0,
             files: [],
             aborted: false,
             batchBuffer: [],
-            lastBatchTime: Date.now(),
-            lastProgressTime: Date.now(),
+            lastBatchTime: now,
+            lastProgressTime: now,
+            startedAt: new Date(now).toISOString(),
         };
 
         try {
@@ -510,8 +593,8 @@ export function registerScanHandlers(windowManager?: WindowManager) {
                     completedAt: new Date().toISOString(),
                 };
                 event.sender.send('scan:progress', completeProgress);
+                // Files were already streamed in scan:files batches; don't resend the full list
                 event.sender.send('scan:done', {
-                    files: ctx.files,
                     folderTree,
                     partial: ctx.aborted,
                 });
@@ -31,6 +31,7 @@ export class LogSanitizer {
     private enabled: boolean;
     private patterns: SanitizePattern[];
     private username: string | null;
+    private userPathPatterns: Array<{ pattern: RegExp; replacement: string }>;
     private pathCache: Map<string, string>;
     private readonly MAX_CACHE_SIZE = 256;
 
@@ -40,6 +41,7 @@ export class LogSanitizer {
         this.enabled = enabled && (!envEnabled || ['true', '1', 'yes'].includes(envEnabled));
         this.patterns = this.compilePatterns();
         this.username = this.getCurrentUsername();
+        this.userPathPatterns = this.compileUserPathPatterns();
         this.pathCache = new Map();
     }
 
@@ -134,6 +136,30 @@ export class LogSanitizer {
         return patterns;
     }
 
+    /**
+     * Compile the home-directory patterns for the current user once, instead of
+     * rebuilding them for every uncached log message.
+     */
+    private compileUserPathPatterns(): Array<{ pattern: RegExp; replacement: string }> {
+        if (!this.username) {
+            return [];
+        }
+
+        const escapedUsername = this.username.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+
+        return [
+            // macOS pattern (/Users/username/)
+            { pattern: new RegExp(`/Users/${escapedUsername}/`, 'g'), replacement: '/Users/[USER]/' },
+            // Linux pattern (/home/username/)
+            { pattern: new RegExp(`/home/${escapedUsername}/`, 'g'), replacement: '/home/[USER]/' },
+            // Windows pattern (C:\Users\username\)
+            {
+                pattern: new RegExp(`[A-Za-z]:\\\\Users\\\\${escapedUsername}\\\\`, 'gi'),
+                replacement: 'C:\\Users\\[USER]\\',
+            },
+        ];
+    }
+
     /**
      * Sanitize file paths to remove usernames.
      */
@@ -149,25 +175,9 @@ export class LogSanitizer {
         }
 
         let sanitized = path;
-        const escapedUsername = this.username.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
-
-        // macOS pattern (/Users/username/)
-        sanitized = sanitized.replace(
-            new RegExp(`/Users/${escapedUsername}/`, 'g'),
-            '/Users/[USER]/'
-        );
-
-        // Linux pattern (/home/username/)
-        sanitized = sanitized.replace(
-            new RegExp(`/home/${escapedUsername}/`, 'g'),
-            '/home/[USER]/'
-        );
-
-        // Windows pattern (C:\Users\username\)
-        sanitized = sanitized.replace(
-            new RegExp(`[A-Za-z]:\\\\Users\\\\${escapedUsername}\\\\`, 'gi'),
-            'C:\\Users\\[USER]\\'
-        );
+        for (const { pattern, replacement } of this.userPathPatterns) {
+            sanitized = sanitized.replace(pattern, replacement);
+        }
 
         // Manage cache size
         if (this.pathCache.size >= this.MAX_CACHE_SIZE) {
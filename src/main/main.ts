@@ -155,6 +155,13 @@ app.whenReady().then(async () => {
         console.error('[Main] Runtime initialization error:', error);
     }
 
+    // Plugin discovery only reads manifests from disk, so let it run while
+    // we wait for the backend to come up instead of after.
+    const pluginInitPromise = pluginManager.initialize();
+    // Mark the rejection handled now; it is still reported when awaited below,
+    // but startServices() can take long enough to trip the unhandled-rejection hook.
+    pluginInitPromise.catch(() => undefined);
+
     // Start backend services FIRST, then create window
     // This ensures API key is available before frontend makes requests
     try {
@@ -172,7 +179,7 @@ app.whenReady().then(async () => {
 
     // Initialize plugin system
     try {
-        await pluginManager.initialize();
+        await pluginInitPromise;
         pluginManager.registerIPCHandlers();
 
         // Set main window reference for plugin notifications
@@ -220,6 +227,7 @@ app.on('before-quit', async (event) => {
     console.log('App before-quit: Stopping services...');
 
     try {
+        await modelManager.flushConfig();
         await serviceManager.stopAll();
         pythonServer.stop();
     } catch (error) {
@@ -6,15 +6,17 @@ export function startDirectMCPServer(windowManager: WindowManager) {
     const server = http.createServer(async (req, res) => {
         // Only accept POST /mcp/activity
         if (req.method === 'POST' && req.url === '/mcp/activity') {
-            let body = '';
+            // Decode once at the end so multi-byte characters split across
+            // chunks are not mangled.
+            const chunks: Buffer[] = [];
 
-            req.on('data', chunk => {
-                body += chunk.toString();
+            req.on('data', (chunk: Buffer) => {
+                chunks.push(chunk);
             });
 
             req.on('end', async () => {
                 try {
-                    const data = JSON.parse(body);
+                    const data = JSON.parse(Buffer.concat(chunks).toString('utf8'));
 
                     // 1. Send 200 OK immediately
                     res.writeHead(200, { 'Content-Type': 'application/json' });
@@ -33,10 +33,11 @@ export function startMCPMonitor(windowManager: WindowManager) {
 
             console.log('[MCP Monitor] Connected to event stream');
 
+            // Let the stream decode UTF-8 so characters split across chunks survive.
+            res.setEncoding('utf8');
             let buffer = '';
-            res.on('data', async (chunk) => {
-                const text = chunk.toString();
-                buffer += text;
+            res.on('data', async (chunk: string) => {
+                buffer += chunk;
 
                 // Process complete lines
                 // SSE events usually end with \n\n
@@ -91,8 +91,9 @@ export class MCPServer {
         }
 
         try {
-            this.pythonPath = this.findPython();
-            console.log(`Using Python: ${this.pythonPath}`);
+            // Probing for Python can spawn an interpreter, so reuse an earlier result
+            const pythonPath = this.getPythonPath();
+            console.log(`Using Python: ${pythonPath}`);
             console.log(`MCP server path: ${this.serverPath}`);
 
             // Read API key - try dev session key first, then legacy paths
@@ -117,7 +118,7 @@ export class MCPServer {
             };
 
             // Run the server module from the backend directory
-            this.process = spawn(this.pythonPath, ['-m', 'server'], {
+            this.process = spawn(pythonPath, ['-m', 'server'], {
                 cwd: this.serverPath,
                 env,
                 stdio: ['pipe', 'pipe', 'pipe'],
@@ -38,13 +38,14 @@ export interface ModelConfig {
     debugMode?: boolean;
 }
 
-
+const CONFIG_SAVE_DEBOUNCE_MS = 250;
 
 export class ModelManager extends EventEmitter {
     private readonly modelRootPath: string;
     private readonly userConfigPath: string;
     private readonly modelsConfigPath: string;
     private activeDownload: Promise<ModelStatusSummary> | null = null;
+    private saveTimer: NodeJS.Timeout | null = null;
     private descriptors: ModelAssetDescriptor[] = [];
     private proxyAgent: any | null = null;
     private config: ModelConfig = {
@@ -120,13 +121,30 @@ export class ModelManager extends EventEmitter {
         }
     }
 
+    // Settings sliders fire set-config on every change; coalesce those into one write
+    private scheduleSave() {
+        if (this.saveTimer) return;
+        this.saveTimer = setTimeout(() => {
+            this.saveTimer = null;
+            void this.saveConfig();
+        }, CONFIG_SAVE_DEBOUNCE_MS);
+    }
+
+    /** Write any pending config change immediately (called before quit). */
+    async flushConfig(): Promise<void> {
+        if (!this.saveTimer) return;
+        clearTimeout(this.saveTimer);
+        this.saveTimer = null;
+        await this.saveConfig();
+    }
+
     async getConfig(): Promise<ModelConfig> {
         return this.config;
     }
 
     async setConfig(newConfig: Partial<ModelConfig>): Promise<void> {
         this.config = { ...this.config, ...newConfig };
-        await this.saveConfig();
+        this.scheduleSave();
         this.emit('config-changed', this.config);
     }
 
@@ -359,6 +377,10 @@ export class ModelManager extends EventEmitter {
 
                         const totalBytes = parseInt(String(response.headers['content-length'] || '0'), 10) || 0;
                         let downloadedBytes = 0;
+                        // Only report when the rounded values change; chunks arrive every few KB
+                        // and identical progress events would just pile up on the IPC channel.
+                        let reportedPercent: number | null = null;
+                        let reportedMb = -1;
                         const fileStream = createWriteStream(tempPath);
 
                         response.pipe(fileStream);
@@ -367,6 +389,11 @@ export class ModelManager extends EventEmitter {
                             downloadedBytes += chunk.length;
                             const percent = totalBytes > 0 ? Math.round((downloadedBytes / totalBytes) * 100) : null;
                             const downloadedMb = Math.round(downloadedBytes / 1024 / 1024);
+                            if (percent === reportedPercent && downloadedMb === reportedMb) {
+                                return;
+                            }
+                            reportedPercent = percent;
+                            reportedMb = downloadedMb;
                             const totalMb = totalBytes > 0 ? Math.round(totalBytes / 1024 / 1024) : null;
                             this.emitProgress({
                                 state: 'downloading',
@@ -451,6 +478,8 @@ export class ModelManager extends EventEmitter {
 
                     const totalBytes = parseInt(String((response.headers as any)?.['content-length'] || '0'), 10) || 0;
                     let downloadedBytes = 0;
+                    let reportedPercent: number | null = null;
+                    let reportedMb = -1;
                     const fileStream = createWriteStream(tempPath);
 
                     (response as any).pipe(fileStream);
@@ -459,6 +488,11 @@ export class ModelManager extends EventEmitter {
                         downloadedBytes += chunk.length;
                         const percent = totalBytes > 0 ? Math.round((downloadedBytes / totalBytes) * 100) : null;
                         const downloadedMb = Math.round(downloadedBytes / 1024 / 1024);
+                        if (percent === reportedPercent && downloadedMb === reportedMb) {
+                            return;
+                        }
+                        reportedPercent = percent;
+                        reportedMb = downloadedMb;
                         const totalMb = totalBytes > 0 ? Math.round(totalBytes / 1024 / 1024) : null;
                         this.emitProgress({
                             state: 'downloading',
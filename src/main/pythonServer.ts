@@ -96,10 +96,11 @@ export class PythonServer {
     }
 
     private async waitForReady(port: number, timeoutMs: number = 30000): Promise<void> {
-        const startTime = Date.now();
+        // Monotonic clock, so a wall-clock jump cannot cut the wait short or stretch it
+        const startTime = performance.now();
         const checkInterval = 500;
 
-        while (Date.now() - startTime < timeoutMs) {
+        while (performance.now() - startTime < timeoutMs) {
             if (!this.process) {
                 console.error('Backend exited unexpectedly');
                 throw new Error('Backend process exited unexpectedly');
@@ -107,6 +108,8 @@ export class PythonServer {
 
             if (this.sessionToken) {
                 try {
+                    // /health is declared for GET only, so probe with GET; a 405 to
+                    // some other method would only show that a server is listening.
                     const response = await fetch(`${config.urls.backend}/health`, {
                         method: 'GET',
                         headers: {
@@ -89,7 +89,7 @@ export const SCAN_FILE_TYPES: Record<string, { kind: FileKind; extensions: strin
 };
 
 // Build extension to kind mapping
-export function getExtensionToKindMap(): Map<string, FileKind> {
+function buildExtensionToKindMap(): Map<string, FileKind> {
     const map = new Map<string, FileKind>();
     for (const [, config] of Object.entries(SCAN_FILE_TYPES)) {
         for (const ext of config.extensions) {
@@ -99,18 +99,24 @@ export function getExtensionToKindMap(): Map<string, FileKind> {
     return map;
 }
 
+// Built once at load; consulted twice for every file visited during a scan
+const EXTENSION_TO_KIND = buildExtensionToKindMap();
+
+// Returns a copy so callers can't mutate the shared lookup table
+export function getExtensionToKindMap(): Map<string, FileKind> {
+    return new Map(EXTENSION_TO_KIND);
+}
+
 // Check if extension is a supported type (excludes code)
 export function isSupportedFileType(extension: string): boolean {
     const ext = extension.toLowerCase().replace(/^\./, '');
-    const map = getExtensionToKindMap();
-    return map.has(ext);
+    return EXTENSION_TO_KIND.has(ext);
 }
 
 // Get file kind from extension (only supported types)
 export function getFileKindFromExtension(extension: string): FileKind | null {
     const ext = extension.toLowerCase().replace(/^\./, '');
-    const map = getExtensionToKindMap();
-    return map.get(ext) || null;
+    return EXTENSION_TO_KIND.get(ext) || null;
 }
 
 // ============================================
@@ -225,17 +231,29 @@ export function getSystemExclusions(): string[] {
     return ['/proc', '/sys', '/dev', '/run', '/snap', '/boot', '/lost+found'];
 }
 
+// Set view of UNIVERSAL_DIR_EXCLUSIONS for O(1) checks on every directory visited
+const UNIVERSAL_DIR_EXCLUSION_SET: ReadonlySet<string> = new Set(UNIVERSAL_DIR_EXCLUSIONS);
+
 // Check if a directory name should be excluded (universal patterns)
 export function shouldExcludeByName(dirName: string): boolean {
-    return UNIVERSAL_DIR_EXCLUSIONS.includes(dirName);
+    return UNIVERSAL_DIR_EXCLUSION_SET.has(dirName);
 }
 
-// Check if a full path should be excluded by system rules
-export function shouldExcludeByPath(fullPath: string, exclusions: string[]): boolean {
-    const normalizedPath = fullPath.replace(/\\/g, '/').toLowerCase();
+function normalizeExclusionPath(value: string): string {
+    return value.replace(/\\/g, '/').toLowerCase();
+}
+
+// Normalize an exclusion list for shouldExcludeByNormalizedPath. Scans do this once
+// up front instead of once per visited entry.
+export function normalizeExclusions(exclusions: string[]): string[] {
+    return exclusions.map(normalizeExclusionPath);
+}
 
-    for (const exclusion of exclusions) {
-        const normalizedExclusion = exclusion.replace(/\\/g, '/').toLowerCase();
+// Check a full path against exclusions already passed through normalizeExclusions
+export function shouldExcludeByNormalizedPath(fullPath: string, normalizedExclusions: string[]): boolean {
+    const normalizedPath = normalizeExclusionPath(fullPath);
+
+    for (const normalizedExclusion of normalizedExclusions) {
         if (normalizedPath.startsWith(normalizedExclusion) || normalizedPath === normalizedExclusion) {
             return true;
         }
@@ -244,6 +262,11 @@ export function shouldExcludeByPath(fullPath: string, exclusions: string[]): boo
     return false;
 }
 
+// Check if a full path should be excluded by system rules
+export function shouldExcludeByPath(fullPath: string, exclusions: string[]): boolean {
+    return shouldExcludeByNormalizedPath(fullPath, normalizeExclusions(exclusions));
+}
+
 // ============================================
 // Default Scan Directories (Smart Recommendations)
 // ============================================
@@ -275,7 +298,8 @@ const CLOUD_SYNC_PATTERNS = {
 // Check if a directory exists
 function directoryExists(dirPath: string): boolean {
     try {
-        return fs.existsSync(dirPath) && fs.statSync(dirPath).isDirectory();
+        // A single stat answers both questions; no separate existsSync probe
+        return fs.statSync(dirPath, { throwIfNoEntry: false })?.isDirectory() ?? false;
     } catch {
         return false;
     }
@@ -514,29 +538,23 @@ function getSettingsPath(): string {
     return path.join(home, '.config/local-cocoa', SETTINGS_FILE);
 }
 
-export function loadScanSettings(): ScanSettings | null {
+export async function loadScanSettings(): Promise<ScanSettings | null> {
     try {
-        const settingsPath = getSettingsPath();
-        if (fs.existsSync(settingsPath)) {
-            const content = fs.readFileSync(settingsPath, 'utf-8');
-            return JSON.parse(content) as ScanSettings;
-        }
+        const content = await fs.promises.readFile(getSettingsPath(), 'utf-8');
+        return JSON.parse(content) as ScanSettings;
     } catch (error) {
-        console.error('Failed to load scan settings:', error);
+        if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+            console.error('Failed to load scan settings:', error);
+        }
     }
     return null;
 }
 
-export function saveScanSettings(settings: ScanSettings): void {
+export async function saveScanSettings(settings: ScanSettings): Promise<void> {
     try {
         const settingsPath = getSettingsPath();
-        const dir = path.dirname(settingsPath);
-
-        if (!fs.existsSync(dir)) {
-            fs.mkdirSync(dir, { recursive: true });
-        }
-
-        fs.writeFileSync(settingsPath, JSON.stringify(settings, null, 2), 'utf-8');
+        await fs.promises.mkdir(path.dirname(settingsPath), { recursive: true });
+        await fs.promises.writeFile(settingsPath, JSON.stringify(settings, null, 2), 'utf-8');
     } catch (error) {
         console.error('Failed to save scan settings:', error);
     }
@@ -568,6 +586,8 @@ export const scanConfigModule = {
     getSystemExclusions,
     shouldExcludeByName,
     shouldExcludeByPath,
+    normalizeExclusions,
+    shouldExcludeByNormalizedPath,
     getSmartRecommendedDirectories,
     detectFileOrigin,
     loadScanSettings,
@@ -93,8 +93,10 @@ const api = {
         ipcRenderer.invoke('files:list-chunks', fileId),
     getChunkHighlight: (chunkId: string, zoom?: number): Promise<string> =>
         ipcRenderer.invoke('files:chunk-highlight', { chunkId, zoom }),
-    getPdfPageImage: (fileId: string, pageNumber: number, zoom?: number): Promise<string> =>
-        ipcRenderer.invoke('files:pdf-page-image', { fileId, pageNumber, zoom }),
+    getPdfPageImage: (fileId: string, pageNumber: number, zoom?: number, version?: string): Promise<string> =>
+        ipcRenderer.invoke('files:pdf-page-image', { fileId, pageNumber, zoom, version }),
+    prefetchPdfPage: (fileId: string, pageNumber: number, zoom?: number, version?: string): Promise<void> =>
+        ipcRenderer.invoke('files:pdf-prefetch-page', { fileId, pageNumber, zoom, version }),
     openFile: (filePath: string): Promise<{ path: string }> =>
         ipcRenderer.invoke('files:open', { path: filePath }),
     deleteFile: (fileId: string): Promise<{ id: string }> => ipcRenderer.invoke('files:delete', fileId),
@@ -324,7 +326,7 @@ const api = {
         customExclusions?: string[];
         onProgress?: (progress: ScanProgress) => void;
         onFiles?: (files: ScannedFile[]) => void;
-        onComplete?: (result: { files: ScannedFile[]; folderTree: FolderNode[]; partial: boolean }) => void;
+        onComplete?: (result: { folderTree: FolderNode[]; partial: boolean }) => void;
         onError?: (error: string) => void;
     }): (() => void) => {
         const progressChannel = 'scan:progress';
@@ -334,7 +336,7 @@ const api = {
 
         const onProgress = (_event: unknown, progress: ScanProgress) => options.onProgress?.(progress);
         const onFiles = (_event: unknown, files: ScannedFile[]) => options.onFiles?.(files);
-        const onDone = (_event: unknown, result: { files: ScannedFile[]; folderTree: FolderNode[]; partial: boolean }) =>
+        const onDone = (_event: unknown, result: { folderTree: FolderNode[]; partial: boolean }) =>
             options.onComplete?.(result);
         const onError = (_event: unknown, error: string) => options.onError?.(error);
 
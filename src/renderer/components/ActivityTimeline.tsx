@@ -1,7 +1,7 @@
 import { useCallback, useEffect, useState, CSSProperties } from 'react';
 import ReactMarkdown from 'react-markdown';
 import { Activity, RefreshCw, Trash2, Play, Square, FileText, FolderOpen } from 'lucide-react';
-import { cn } from '../lib/utils';
+import { cn, createDateFormatter } from '../lib/utils';
 import { ActivitySummariesPanel } from './ActivitySummariesPanel';
 import type { ActivityLog, IndexedFile } from '../types';
 
@@ -14,6 +14,8 @@ interface ActivityTimelineProps {
 
 type ActivityTab = 'timeline' | 'summaries';
 
+const formatLogTime = createDateFormatter({ hour: '2-digit', minute: '2-digit', second: '2-digit' });
+
 export function ActivityTimeline({ isTracking, onToggleTracking, summaryFiles = [], onOpenFile }: ActivityTimelineProps) {
     const [logs, setLogs] = useState<ActivityLog[]>([]);
     const [summary, setSummary] = useState<string | null>(null);
@@ -265,7 +267,7 @@ export function ActivityTimeline({ isTracking, onToggleTracking, summaryFiles =
                                                             <div className="flex-1 min-w-0">
                                                                 <div className="flex items-center gap-2 mb-1">
                                                                     <span className="text-[10px] font-mono font-medium text-muted-foreground bg-muted/50 px-1.5 py-0.5 rounded">
-                                                                        {new Date(log.timestamp).toLocaleTimeString([], { hour: '2-digit', minute: '2-digit', second: '2-digit' })}
+                                                                        {formatLogTime(log.timestamp)}
                                                                     </span>
                                                                 </div>
                                                                 <p className={cn(
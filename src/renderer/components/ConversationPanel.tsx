@@ -58,6 +58,23 @@ interface ConversationPanelProps {
     onResume?: (mode?: SearchMode) => Promise<void>;
 }
 
+// Phrases the chunk analyzer uses to say a chunk does not answer the question.
+// Explicit markers are the LLM's clear signal; contextual phrases need more care.
+// All are plain uppercase literals, so each list compiles to one alternation
+// that is built once here rather than rebuilt for every reference on every render.
+const EXPLICIT_NO_ANSWER_MARKERS = ['NO_ANSWER', 'NO ANSWER'];
+const CONTEXTUAL_NO_ANSWER_PHRASES = [
+    'DOES NOT PROVIDE', 'DOES NOT CONTAIN',
+    "DOESN'T PROVIDE", "DOESN'T CONTAIN", 'NOT PROVIDE SPECIFIC',
+    'NOT CONTAIN SPECIFIC', 'NO SPECIFIC', 'NO RELEVANT', 'NOT RELEVANT',
+    'CANNOT ANSWER', "CAN'T ANSWER", 'NO INFORMATION', 'NOT MENTIONED',
+    "DOESN'T MENTION", 'DOES NOT MENTION'
+];
+const EXPLICIT_NO_ANSWER_RE = new RegExp(EXPLICIT_NO_ANSWER_MARKERS.join('|'));
+const CONTEXTUAL_NO_ANSWER_RE = new RegExp(CONTEXTUAL_NO_ANSWER_PHRASES.join('|'));
+const ANY_NO_ANSWER_RE = new RegExp([...EXPLICIT_NO_ANSWER_MARKERS, ...CONTEXTUAL_NO_ANSWER_PHRASES].join('|'));
+const SENTENCE_BREAK_RE = /[.?!]\s/;
+
 function getReferenceLabel(reference: SearchHit): { name: string; location: string } {
     const metadata = reference.metadata ?? {};
     const name = (metadata.file_name || metadata.name || metadata.filename || metadata.title) as string | undefined;
@@ -97,26 +114,7 @@ function ReferenceItem({ reference, index, onPreview }: { reference: SearchHit,
 
     // Check if comment indicates no relevant information
     const commentUpper = analysisComment?.toUpperCase() ?? '';
-    const noAnswerPatterns = [
-        'NO_ANSWER',
-        'NO ANSWER',
-        'DOES NOT PROVIDE',
-        'DOES NOT CONTAIN',
-        "DOESN'T PROVIDE",
-        "DOESN'T CONTAIN",
-        'NOT PROVIDE SPECIFIC',
-        'NOT CONTAIN SPECIFIC',
-        'NO SPECIFIC',
-        'NO RELEVANT',
-        'NOT RELEVANT',
-        'CANNOT ANSWER',
-        "CAN'T ANSWER",
-        'NO INFORMATION',
-        'NOT MENTIONED',
-        "DOESN'T MENTION",
-        'DOES NOT MENTION',
-    ];
-    const containsNoAnswer = noAnswerPatterns.some(pattern => commentUpper.includes(pattern));
+    const containsNoAnswer = ANY_NO_ANSWER_RE.test(commentUpper);
     const isRelevant = hasAnswer === true && !containsNoAnswer;
 
     // Extract page information from metadata
@@ -294,21 +292,13 @@ function RecalledContext({ references, onPreview, isComplete, analysisProgress }
         const comment = r.analysisComment?.toUpperCase() ?? '';
 
         // Explicit markers - check globally (LLM's clear signal)
-        const explicitMarkers = ['NO_ANSWER', 'NO ANSWER'];
-        if (explicitMarkers.some(marker => comment.includes(marker))) {
+        if (EXPLICIT_NO_ANSWER_RE.test(comment)) {
             return false;
         }
 
         // Contextual patterns - only check in first sentence to avoid false positives
-        const firstSentence = comment.split(/[.?!]\s/)[0] || comment;
-        const contextualPatterns = [
-            'DOES NOT PROVIDE', 'DOES NOT CONTAIN',
-            "DOESN'T PROVIDE", "DOESN'T CONTAIN", 'NOT PROVIDE SPECIFIC',
-            'NOT CONTAIN SPECIFIC', 'NO SPECIFIC', 'NO RELEVANT', 'NOT RELEVANT',
-            'CANNOT ANSWER', "CAN'T ANSWER", 'NO INFORMATION', 'NOT MENTIONED',
-            "DOESN'T MENTION", 'DOES NOT MENTION'
-        ];
-        return !contextualPatterns.some(pattern => firstSentence.includes(pattern));
+        const firstSentence = comment.split(SENTENCE_BREAK_RE)[0] || comment;
+        return !CONTEXTUAL_NO_ANSWER_RE.test(firstSentence);
     };
 
     // Calculate stats for analyzed chunks
@@ -629,21 +619,40 @@ export function ConversationPanel({
     }
 
     function renderMessageText(text: string, references?: SearchHit[]) {
+        // Index references by metadata.index once per render instead of scanning the
+        // list for every citation in every paragraph and list item.
+        let referencesByIndex: Map<number, SearchHit> | null = null;
+        const findReference = (citationNumber: number) => {
+            if (!referencesByIndex) {
+                referencesByIndex = new Map();
+                for (const r of references ?? []) {
+                    const index = r.metadata?.index;
+                    // Keep the first match, as Array.find would
+                    if (typeof index === 'number' && !referencesByIndex.has(index)) {
+                        referencesByIndex.set(index, r);
+                    }
+                }
+            }
+            return referencesByIndex.get(citationNumber);
+        };
+
         // Process reference citations [1], [2], etc.
         // Also handles comma-separated formats like [11, 18, 29] by normalizing them first
         const processReferences = (content: string) => {
-            if (!references || references.length === 0) {
+            // Most text nodes carry no citation at all; a plain substring scan
+            // skips the regex passes below for them.
+            if (!references || references.length === 0 || !content.includes('[')) {
                 return content;
             }
 
             // First, normalize comma-separated citations like [11, 18, 29] to [11][18][29]
-            const normalizedContent = content.replace(
+            const normalizedContent = content.includes(',') ? content.replace(
                 /\[\s*(\d+(?:\s*,\s*\d+)+)\s*\]/g,
                 (match, nums) => {
                     const numbers = nums.split(/\s*,\s*/);
                     return numbers.map((n: string) => `[${n.trim()}]`).join('');
                 }
-            );
+            ) : content;
 
             const parts = normalizedContent.split(/(\[\s*\d+\s*\])/g);
             return parts.map((part, i) => {
@@ -652,9 +661,10 @@ export function ConversationPanel({
                     const citationNumber = parseInt(match[1], 10);
                     // Find reference by metadata.index (global citation index from backend)
                     // This is critical for multi-path retrieval where indices span multiple rounds
-                    const reference = references.find(r => r.metadata?.index === citationNumber);
+                    const reference = findReference(citationNumber);
                     if (reference) {
-                        const { location } = getReferenceLabel(reference);
+                        const label = getReferenceLabel(reference);
+                        const { location } = label;
                         const isClickable = !!(reference.fileId || location);
 
                         if (!isClickable) {
@@ -669,7 +679,7 @@ export function ConversationPanel({
                                     onPreviewReference?.(reference);
                                 }}
                                 className="inline-flex items-center justify-center rounded-sm bg-primary/10 px-1.5 py-0.5 text-[10px] font-bold text-primary hover:bg-primary/20 hover:underline mx-0.5 align-super cursor-pointer transition-colors"
-                                title={getReferenceLabel(reference).name}
+                                title={label.name}
                             >
                                 {match[1]}
                             </button>
@@ -34,12 +34,15 @@ import {
     Play,
     Pause
 } from 'lucide-react';
-import { cn } from '../lib/utils';
+import { cn, createDateFormatter } from '../lib/utils';
 import { useEarlogData, EarlogSession, EarlogTranscript, EarlogBackend } from '../hooks/useEarlogData';
 
 type EarlogTab = 'live' | 'history' | 'settings';
 type DisplayFilter = 'all' | 'human' | 'computer';
 
+const formatClockTime = createDateFormatter({ hour: '2-digit', minute: '2-digit' });
+const formatShortDate = createDateFormatter({ month: 'short', day: 'numeric' });
+
 export function EarlogPanel() {
     const {
         state,
@@ -142,9 +145,9 @@ export function EarlogPanel() {
     const formatTimeRange = (start: string, end?: string) => {
         const startDate = new Date(start);
         const endDate = end ? new Date(end) : new Date();
-        const startStr = startDate.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
-        const endStr = endDate.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
-        const dateStr = startDate.toLocaleDateString([], { month: 'short', day: 'numeric' });
+        const startStr = formatClockTime(startDate);
+        const endStr = formatClockTime(endDate);
+        const dateStr = formatShortDate(startDate);
         return `${dateStr} ${startStr}–${endStr}`;
     };
 
@@ -432,7 +435,7 @@ function LiveTimeline({
             if (!byMinute.has(minuteKey)) {
                 byMinute.set(minuteKey, {
                     minuteKey,
-                    clockTime: date.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }),
+                    clockTime: formatClockTime(date),
                     humanText: [],
                     computerText: [],
                 });
@@ -781,7 +784,7 @@ function SessionTimeline({ session }: { session: EarlogSession }) {
         
         if (!byMinute.has(minuteKey)) {
             byMinute.set(minuteKey, {
-                time: date.toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' }),
+                time: formatClockTime(date),
                 items: [],
             });
         }
@@ -166,11 +166,11 @@ export function MainAppView() {
         try {
             const paths = await api.pickFolders();
             if (paths && paths.length > 0) {
-                const addedFolderIds: string[] = [];
-                for (const path of paths) {
-                    const folder = await api.addFolder(path);
-                    if (folder?.id) addedFolderIds.push(folder.id);
-                }
+                // Register the picked folders concurrently; indexing is kicked off once for all of them
+                const addedFolders = await Promise.all(paths.map((path) => api.addFolder(path)));
+                const addedFolderIds = addedFolders
+                    .map((folder) => folder?.id)
+                    .filter((id): id is string => Boolean(id));
 
                 // Auto-start indexing after adding folders using fast staged indexing
                 if (addedFolderIds.length > 0 && api.runStagedIndex) {
@@ -193,31 +193,23 @@ export function MainAppView() {
             const filePaths = await api.pickFiles();
             if (!filePaths || filePaths.length === 0) return;
 
-            // Group files by their parent directories
-            const filesByParent = new Map<string, string[]>();
-            for (const filePath of filePaths) {
-                const parentDir = filePath.split('/').slice(0, -1).join('/');
-                const existing = filesByParent.get(parentDir) || [];
-                existing.push(filePath);
-                filesByParent.set(parentDir, existing);
-            }
+            // Collect the unique parent directories
+            const parentDirs = [...new Set(filePaths.map(filePath => filePath.split('/').slice(0, -1).join('/')))];
 
             // Register each parent directory with 'manual' scan mode (won't trigger full folder scan)
-            // Then index only the selected files using fast staged indexing
-            for (const [parentDir, files] of filesByParent) {
-                // Add folder with 'manual' mode - this prevents automatic folder scanning
+            await Promise.all(parentDirs.map(async (parentDir) => {
                 try {
                     await api.addFolder(parentDir, undefined, 'manual');
                 } catch {
                     // Folder might already exist, that's fine
                 }
+            }));
 
-                // Index only the specific files using fast staged indexing
-                await api.runStagedIndex({
-                    folders: [parentDir],
-                    files: files,
-                });
-            }
+            // Index only the selected files in one staged run rather than one per folder
+            await api.runStagedIndex({
+                folders: parentDirs,
+                files: filePaths,
+            });
 
             await refreshData();
         } catch (error) {
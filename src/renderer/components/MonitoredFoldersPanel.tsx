@@ -1,4 +1,4 @@
-import { useEffect, useMemo, useState, useRef, useCallback } from 'react';
+import { useEffect, useMemo, useState, useRef } from 'react';
 import { Folder, Plus, Trash2, AlertTriangle, Info, ChevronDown, ChevronUp, FileText, Clock, ArrowUp } from 'lucide-react';
 import { cn } from '../lib/utils';
 import type { FolderRecord, IndexingItem, IndexedFile } from '../types';
@@ -181,6 +181,37 @@ function IndexModeTag({ mode, errorReason, progress }: { mode: IndexMode; errorR
     );
 }
 
+// Normalize paths for comparison: backslashes become '/' and trailing slashes are dropped
+function normalizePath(p: string): string {
+    return p?.replace(/\\/g, '/').replace(/\/+$/, '') ?? '';
+}
+
+// Find the indexing item for a file - using fileId, fileName, or path matching.
+// The file's own paths are normalized once rather than once per queued item.
+function findProcessingItem(file: IndexedFile, items: IndexingItem[]): IndexingItem | undefined {
+    let fileFullPath: string | null = null;
+    let filePath: string | null = null;
+    return items.find(item => {
+        // Try matching by file ID first (most reliable)
+        if (item.fileId && item.fileId === file.id) {
+            return true;
+        }
+        // Try matching by file name
+        if (item.fileName && item.fileName === file.name) {
+            return true;
+        }
+        // Try matching by path
+        const itemPath = normalizePath(item.filePath ?? '');
+        fileFullPath ??= normalizePath(file.fullPath);
+        filePath ??= normalizePath(file.path);
+        return (
+            itemPath === fileFullPath ||
+            itemPath === filePath ||
+            itemPath.endsWith('/' + file.name)
+        );
+    });
+}
+
 function formatTimestamp(value: string | null | undefined): string {
     if (!value) return 'Never indexed';
     try {
@@ -212,32 +243,6 @@ export function MonitoredFoldersPanel({
     const [folderModes, setFolderModes] = useState<Record<string, 'fast' | 'deep'>>({});
     const [expandedFolderId, setExpandedFolderId] = useState<string | null>(null);
 
-    // Normalize paths for comparison
-    const normalizePath = (p: string) => p?.replace(/\\/g, '/').replace(/\/+$/, '') ?? '';
-
-    // Check if a file is being processed - using fileId, fileName, or path matching
-    const isFileProcessing = useCallback((file: IndexedFile, items: IndexingItem[]) => {
-        return items.some(item => {
-            // Try matching by file ID first (most reliable)
-            if (item.fileId && item.fileId === file.id) {
-                return true;
-            }
-            // Try matching by file name
-            if (item.fileName && item.fileName === file.name) {
-                return true;
-            }
-            // Try matching by path
-            const itemPath = normalizePath(item.filePath ?? '');
-            const fileFullPath = normalizePath(file.fullPath);
-            const filePath = normalizePath(file.path);
-            return (
-                itemPath === fileFullPath ||
-                itemPath === filePath ||
-                itemPath.endsWith('/' + file.name)
-            );
-        });
-    }, []);
-
     // Get files for the expanded folder, sorted with processing first, then errors, then pending, then indexed
     const expandedFolderFiles = useMemo(() => {
         if (!expandedFolderId) return [];
@@ -248,8 +253,8 @@ export function MonitoredFoldersPanel({
             .filter((file) => file.folderId === expandedFolderId)
             .sort((a, b) => {
                 // Check if files are being processed
-                const aProcessing = isFileProcessing(a, items);
-                const bProcessing = isFileProcessing(b, items);
+                const aProcessing = Boolean(findProcessingItem(a, items));
+                const bProcessing = Boolean(findProcessingItem(b, items));
 
                 // Processing files come first
                 if (aProcessing && !bProcessing) return -1;
@@ -264,7 +269,24 @@ export function MonitoredFoldersPanel({
                 // Then by name
                 return a.name.localeCompare(b.name);
             });
-    }, [expandedFolderId, files, indexingItems, isFileProcessing]);
+    }, [expandedFolderId, files, indexingItems]);
+
+    // Per-folder status counts, tallied in a single pass over the files list
+    const fileCountsByFolder = useMemo(() => {
+        const counts = new Map<string, { total: number; indexed: number; error: number; pending: number }>();
+        for (const file of files) {
+            let entry = counts.get(file.folderId);
+            if (!entry) {
+                entry = { total: 0, indexed: 0, error: 0, pending: 0 };
+                counts.set(file.folderId, entry);
+            }
+            entry.total += 1;
+            if (file.indexStatus === 'indexed' || !file.indexStatus) entry.indexed += 1;
+            else if (file.indexStatus === 'error') entry.error += 1;
+            else if (file.indexStatus === 'pending') entry.pending += 1;
+        }
+        return counts;
+    }, [files]);
 
     const readStoredMode = (folderId: string): 'fast' | 'deep' => {
         try {
@@ -413,13 +435,13 @@ export function MonitoredFoldersPanel({
                         const queuedCount = folderItems.length;
 
                         // Count files by status from the files list
-                        const folderFiles = files.filter(f => f.folderId === folder.id);
-                        const indexedFilesCount = folderFiles.filter(f => f.indexStatus === 'indexed' || !f.indexStatus).length;
-                        const errorFilesCount = folderFiles.filter(f => f.indexStatus === 'error').length;
-                        const pendingFilesCount = folderFiles.filter(f => f.indexStatus === 'pending').length;
+                        const folderCounts = fileCountsByFolder.get(folder.id);
+                        const indexedFilesCount = folderCounts?.indexed ?? 0;
+                        const errorFilesCount = folderCounts?.error ?? 0;
+                        const pendingFilesCount = folderCounts?.pending ?? 0;
 
                         // Total is simply the number of files we know about
-                        const total = folderFiles.length || 1;
+                        const total = folderCounts?.total || 1;
                         const failedCount = errorFilesCount;
 
                         // Calculate progress: indexed / total
@@ -590,25 +612,7 @@ export function MonitoredFoldersPanel({
                                             {expandedFolderFiles.length ? (
                                                 expandedFolderFiles.map((file) => {
                                                     // Check if this file is currently being processed
-                                                    const processingItem = (indexingItems ?? []).find(item => {
-                                                        // Try matching by file ID first (most reliable)
-                                                        if (item.fileId && item.fileId === file.id) {
-                                                            return true;
-                                                        }
-                                                        // Try matching by file name
-                                                        if (item.fileName && item.fileName === file.name) {
-                                                            return true;
-                                                        }
-                                                        // Try matching by path
-                                                        const itemPath = normalizePath(item.filePath ?? '');
-                                                        const fileFullPath = normalizePath(file.fullPath);
-                                                        const filePath = normalizePath(file.path);
-                                                        return (
-                                                            itemPath === fileFullPath ||
-                                                            itemPath === filePath ||
-                                                            itemPath.endsWith('/' + file.name)
-                                                        );
-                                                    });
+                                                    const processingItem = findProcessingItem(file, indexingItems ?? []);
                                                     const isProcessing = !!processingItem;
                                                     const processingProgress = processingItem?.progress ?? null;
 
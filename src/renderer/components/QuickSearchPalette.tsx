@@ -178,10 +178,10 @@ export function QuickSearchPalette({
     useEffect(() => {
         let interval: NodeJS.Timeout;
         if (isSearching) {
-            const startTime = Date.now();
+            const startTime = performance.now();
             setElapsedTime(0);
             interval = setInterval(() => {
-                setElapsedTime(Date.now() - startTime);
+                setElapsedTime(performance.now() - startTime);
             }, 50); // Update frequently for smooth fractions
         }
         return () => clearInterval(interval);
@@ -282,9 +282,11 @@ export function QuickSearchShell() {
                                             // Update file timings state
                                             setFileFirstSeenMs({ ...fileTimings });
 
-                                            // Merge new hits with accumulated hits
-                                            accumulatedHits = [...accumulatedHits, ...hits];
-                                            setResults([...accumulatedHits]);
+                                            // Merge new hits with accumulated hits. concat already
+                                            // yields a fresh array and it is never mutated afterwards,
+                                            // so it can go to state as-is.
+                                            accumulatedHits = accumulatedHits.concat(hits);
+                                            setResults(accumulatedHits);
                                             setCurrentSearchStage(stage);
                                             setStatusMessage(STAGE_LABELS[stage] || `Found ${accumulatedHits.length} results`);
                                         } else if (!done) {
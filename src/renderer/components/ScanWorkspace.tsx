@@ -652,6 +652,8 @@ export function ScanWorkspace({ className }: ScanWorkspaceProps) {
         } catch { /* ignore */ }
         return [];
     });
+    // The results array last written to sessionStorage (initially the restored one)
+    const persistedScanFilesRef = useRef<ScannedFile[]>(scannedFiles);
     const [_folderTree, setFolderTree] = useState<FolderNode[]>([]);
     const [scanStartTime, setScanStartTime] = useState<number | null>(null);
     const [cancelFn, setCancelFn] = useState<(() => void) | null>(null);
@@ -708,10 +710,13 @@ export function ScanWorkspace({ className }: ScanWorkspaceProps) {
     // Save scan results to sessionStorage ONLY when scan completes (not during scanning)
     // This avoids performance issues from serializing 15k+ files on every batch
     useEffect(() => {
-        if (scanProgress.status === 'completed' && scannedFiles.length > 0) {
+        // Skip the write when these exact results are already stored, e.g. right after
+        // restoring them on mount
+        if (scanProgress.status === 'completed' && scannedFiles.length > 0 && persistedScanFilesRef.current !== scannedFiles) {
             try {
                 sessionStorage.setItem(SCAN_RESULTS_KEY, JSON.stringify(scannedFiles));
                 sessionStorage.setItem(SCAN_PROGRESS_KEY, JSON.stringify(scanProgress));
+                persistedScanFilesRef.current = scannedFiles;
             } catch { /* ignore quota errors */ }
         }
     }, [scanProgress.status, scannedFiles]);
@@ -855,14 +860,15 @@ export function ScanWorkspace({ className }: ScanWorkspaceProps) {
 
             // Ensure all parent folders are registered with 'manual' scan mode
             // This prevents folders from being scanned during startup/poll refresh
-            for (const dir of parentDirs) {
+            // The registrations are independent, so issue them together
+            await Promise.all(parentDirs.map(async (dir) => {
                 try {
                     await api.addFolder(dir, undefined, 'manual');
                 } catch (folderError) {
                     // Folder might already exist, that's fine
                     console.log('Folder may already exist:', folderError);
                 }
-            }
+            }));
 
             // Use staged API for both fast and deep modes
             // For deep mode, enable deep stage first, then run staged index
@@ -1223,8 +1229,12 @@ export function ScanWorkspace({ className }: ScanWorkspaceProps) {
                     }
                 },
                 onComplete: (result) => {
-                    const files = result.files.filter(f => f.kind !== 'code');
-                    setScannedFiles(files);
+                    // Every file already arrived through onFiles; flush what is still buffered
+                    const bufferedFiles = filesBufferRef.current;
+                    filesBufferRef.current = [];
+                    if (bufferedFiles.length > 0) {
+                        setScannedFiles(prev => [...prev, ...bufferedFiles]);
+                    }
                     setFolderTree(result.folderTree);
                     setScanProgress(prev => ({
                         ...prev,
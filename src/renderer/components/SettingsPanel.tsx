@@ -515,12 +515,23 @@ export function SettingsPanel({ initialTab = 'general' }: SettingsPanelProps) {
             if (!api) return;
 
             try {
-                const dirs = await api.getRecommendedDirectories?.();
+                const [dirsResult, settingsResult] = await Promise.allSettled([
+                    api.getRecommendedDirectories?.(),
+                    api.getScanSettings?.(),
+                ]);
+                const dirs = dirsResult.status === 'fulfilled' ? dirsResult.value : undefined;
+                if (dirsResult.status === 'rejected') {
+                    console.error('Failed to load recommended directories:', dirsResult.reason);
+                }
+                const settings = settingsResult.status === 'fulfilled' ? settingsResult.value : undefined;
+                if (settingsResult.status === 'rejected') {
+                    console.error('Failed to load scan settings:', settingsResult.reason);
+                }
+
                 if (dirs) {
                     setRecommendedDirs(dirs);
                 }
 
-                const settings = await api.getScanSettings?.();
                 if (settings?.scope) {
                     setScanScope(settings.scope);
                 } else if (dirs) {
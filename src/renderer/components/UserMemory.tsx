@@ -16,7 +16,7 @@ import {
     Search,
     User
 } from 'lucide-react';
-import { cn } from '../lib/utils';
+import { cn, createDateFormatter } from '../lib/utils';
 
 interface MemCellMemory {
     id: string;
@@ -142,6 +142,44 @@ type TimelineEntry = {
     sourceName?: string;
 };
 
+const formatDateTime = createDateFormatter({
+    year: 'numeric', month: 'numeric', day: 'numeric',
+    hour: 'numeric', minute: 'numeric', second: 'numeric',
+});
+const formatShortDate = createDateFormatter({ year: 'numeric', month: 'short', day: 'numeric' });
+
+type MemorySource = { sourceName?: string; sourcePath?: string };
+
+function extractSource(metadata?: Record<string, unknown>): MemorySource | null {
+    if (!metadata) return null;
+    const sourceName =
+        (metadata.file_name as string | undefined) ??
+        (metadata.fileName as string | undefined) ??
+        (metadata.name as string | undefined);
+    const sourcePath =
+        (metadata.file_path as string | undefined) ??
+        (metadata.filePath as string | undefined) ??
+        (metadata.path as string | undefined);
+    if (!sourceName && !sourcePath) return null;
+    return { sourceName, sourcePath };
+}
+
+// Sort memory items by timestamp. Each ISO string is parsed once up front instead of
+// twice per comparison; items whose timestamp is missing get missingTime, and any
+// comparison involving an unparseable timestamp is treated as a tie.
+function sortByTimestamp<T extends { timestamp?: string }>(items: T[], order: 'newest' | 'oldest', missingTime = Number.NaN): T[] {
+    const times = new Map<T, number>();
+    for (const item of items) {
+        times.set(item, item.timestamp ? new Date(item.timestamp).getTime() : missingTime);
+    }
+    return items.sort((a, b) => {
+        const aTime = times.get(a)!;
+        const bTime = times.get(b)!;
+        if (Number.isNaN(aTime) || Number.isNaN(bTime)) return 0;
+        return order === 'newest' ? bTime - aTime : aTime - bTime;
+    });
+}
+
 export function UserMemory() {
     const { t } = useTranslation();
     const [activeTab, setActiveTab] = useState<MemoryTab>('overview');
@@ -310,14 +348,21 @@ export function UserMemory() {
         setLoading(true);
         try {
             const api = window.api;
-            if (api?.memoryGetMemcells) {
-                const data = await api.memoryGetMemcells(userId, 50, 0);
-                setMemcells(data);
+            // Also fetch episodes to populate episodesByMemcell map; the two
+            // requests are independent, so issue them together
+            const [memcellsResult, episodesResult] = await Promise.allSettled([
+                api?.memoryGetMemcells ? api.memoryGetMemcells(userId, 50, 0) : Promise.resolve(null),
+                api?.memoryGetEpisodes ? api.memoryGetEpisodes(userId, 100, 0) : Promise.resolve(null),
+            ]);
+            if (memcellsResult.status === 'fulfilled' && memcellsResult.value) {
+                setMemcells(memcellsResult.value);
+            } else if (memcellsResult.status === 'rejected') {
+                console.error('Failed to fetch memcells', memcellsResult.reason);
             }
-            // Also fetch episodes to populate episodesByMemcell map
-            if (api?.memoryGetEpisodes) {
-                const episodesData = await api.memoryGetEpisodes(userId, 100, 0);
-                setEpisodes(episodesData);
+            if (episodesResult.status === 'fulfilled' && episodesResult.value) {
+                setEpisodes(episodesResult.value);
+            } else if (episodesResult.status === 'rejected') {
+                console.error('Failed to fetch episodes', episodesResult.reason);
             }
         } catch (error) {
             console.error('Failed to fetch memcells', error);
@@ -405,34 +450,20 @@ export function UserMemory() {
         });
     };
 
-    const formatDate = (dateStr: string) => {
-        try {
-            const date = new Date(dateStr);
-            return date.toLocaleString();
-        } catch {
-            return dateStr;
-        }
-    };
+    const formatDate = (dateStr: string) => formatDateTime(dateStr);
 
     const formatDateShort = (dateStr?: string) => {
         if (!dateStr) return 'No timestamp';
-        try {
-            const date = new Date(dateStr);
-            return date.toLocaleDateString(undefined, {
-                year: 'numeric',
-                month: 'short',
-                day: 'numeric',
-            });
-        } catch {
-            return dateStr;
-        }
+        return formatShortDate(dateStr);
     };
 
-    const normalizeText = (value: string) => value.toLowerCase();
+    // Normalize the search term once per render; matchesSearch runs for every row of
+    // every memory type
+    const searchNeedle = searchTerm.trim().toLowerCase();
 
     const matchesSearch = (value: string) => {
-        if (!searchTerm.trim()) return true;
-        return normalizeText(value).includes(normalizeText(searchTerm.trim()));
+        if (!searchNeedle) return true;
+        return value.toLowerCase().includes(searchNeedle);
     };
 
     const inTimeRange = (dateStr?: string) => {
@@ -456,6 +487,14 @@ export function UserMemory() {
         return map;
     }, [episodes]);
 
+    // Source info read from each episode's metadata once, so event logs and
+    // foresights that share a parent episode don't re-extract it per row
+    const episodeSourcesById = useMemo(() => {
+        const map = new Map<string, MemorySource | null>();
+        episodes.forEach(ep => map.set(ep.id, extractSource(ep.metadata)));
+        return map;
+    }, [episodes]);
+
     const eventsByEpisode = useMemo(() => {
         const map = new Map<string, EventLog[]>();
         eventLogs.forEach(log => {
@@ -478,20 +517,6 @@ export function UserMemory() {
         return map;
     }, [foresights]);
 
-    const extractSource = (metadata?: Record<string, unknown>) => {
-        if (!metadata) return null;
-        const sourceName =
-            (metadata.file_name as string | undefined) ??
-            (metadata.fileName as string | undefined) ??
-            (metadata.name as string | undefined);
-        const sourcePath =
-            (metadata.file_path as string | undefined) ??
-            (metadata.filePath as string | undefined) ??
-            (metadata.path as string | undefined);
-        if (!sourceName && !sourcePath) return null;
-        return { sourceName, sourcePath };
-    };
-
     const handleOpenSource = async (path?: string) => {
         if (!path) return;
         try {
@@ -522,13 +547,7 @@ export function UserMemory() {
             const text = `${mc.subject ?? ''} ${mc.summary ?? ''}`;
             return matchesSearch(text) && inTimeRange(mc.timestamp);
         });
-        items.sort((a, b) => {
-            const aTime = new Date(a.timestamp).getTime();
-            const bTime = new Date(b.timestamp).getTime();
-            if (Number.isNaN(aTime) || Number.isNaN(bTime)) return 0;
-            return sortOrder === 'newest' ? bTime - aTime : aTime - bTime;
-        });
-        return items;
+        return sortByTimestamp(items, sortOrder);
     }, [memcells, searchTerm, timeRange, sortOrder]);
 
     const episodesByMemcell = useMemo(() => {
@@ -547,13 +566,7 @@ export function UserMemory() {
             const text = `${ep.subject ?? ''} ${ep.summary ?? ''} ${ep.episode ?? ''}`;
             return matchesSearch(text) && inTimeRange(ep.timestamp);
         });
-        items.sort((a, b) => {
-            const aTime = new Date(a.timestamp).getTime();
-            const bTime = new Date(b.timestamp).getTime();
-            if (Number.isNaN(aTime) || Number.isNaN(bTime)) return 0;
-            return sortOrder === 'newest' ? bTime - aTime : aTime - bTime;
-        });
-        return items;
+        return sortByTimestamp(items, sortOrder);
     }, [episodes, searchTerm, timeRange, sortOrder]);
 
     const filteredEventLogs = useMemo(() => {
@@ -563,13 +576,7 @@ export function UserMemory() {
             const linkedOk = showLinkedOnly ? Boolean(log.parent_episode_id) : true;
             return matchesSearch(text) && linkedOk && inTimeRange(log.timestamp);
         });
-        items.sort((a, b) => {
-            const aTime = new Date(a.timestamp).getTime();
-            const bTime = new Date(b.timestamp).getTime();
-            if (Number.isNaN(aTime) || Number.isNaN(bTime)) return 0;
-            return sortOrder === 'newest' ? bTime - aTime : aTime - bTime;
-        });
-        return items;
+        return sortByTimestamp(items, sortOrder);
     }, [eventLogs, episodesById, searchTerm, showLinkedOnly, timeRange, sortOrder]);
 
     const filteredForesights = useMemo(() => {
@@ -586,7 +593,7 @@ export function UserMemory() {
     const timelineEntries = useMemo(() => {
         const entries: TimelineEntry[] = [];
         episodes.forEach(ep => {
-            const source = extractSource(ep.metadata);
+            const source = episodeSourcesById.get(ep.id);
             entries.push({
                 id: ep.id,
                 type: 'episode',
@@ -599,7 +606,7 @@ export function UserMemory() {
         });
         eventLogs.forEach(log => {
             const parent = log.parent_episode_id ? episodesById.get(log.parent_episode_id) : undefined;
-            const source = extractSource(parent?.metadata);
+            const source = parent ? episodeSourcesById.get(parent.id) : null;
             entries.push({
                 id: log.id,
                 type: 'event',
@@ -613,7 +620,7 @@ export function UserMemory() {
         });
         foresights.forEach(fs => {
             const parent = fs.parent_episode_id ? episodesById.get(fs.parent_episode_id) : undefined;
-            const source = extractSource(parent?.metadata);
+            const source = parent ? episodeSourcesById.get(parent.id) : null;
             entries.push({
                 id: fs.id,
                 type: 'foresight',
@@ -629,14 +636,9 @@ export function UserMemory() {
             const text = `${entry.title} ${entry.body}`;
             return matchesSearch(text) && inTimeRange(entry.timestamp);
         });
-        filtered.sort((a, b) => {
-            const aTime = a.timestamp ? new Date(a.timestamp).getTime() : 0;
-            const bTime = b.timestamp ? new Date(b.timestamp).getTime() : 0;
-            if (aTime === bTime) return 0;
-            return sortOrder === 'newest' ? bTime - aTime : aTime - bTime;
-        });
-        return filtered;
-    }, [episodes, eventLogs, foresights, episodesById, searchTerm, timeRange, sortOrder]);
+        // Entries without a timestamp sort as the epoch
+        return sortByTimestamp(filtered, sortOrder, 0);
+    }, [episodes, eventLogs, foresights, episodesById, episodeSourcesById, searchTerm, timeRange, sortOrder]);
 
     const recentEpisodes = useMemo(() => {
         const items = summary?.recent_episodes ?? [];
@@ -1665,7 +1667,7 @@ export function UserMemory() {
                             filteredEpisodes.map(ep => {
                                 const relatedEvents = eventsByEpisode.get(ep.id) ?? [];
                                 const relatedForesights = foresightsByEpisode.get(ep.id) ?? [];
-                                const source = extractSource(ep.metadata);
+                                const source = episodeSourcesById.get(ep.id) ?? null;
                                 return (
                                     <div
                                         key={ep.id}
@@ -1783,7 +1785,7 @@ export function UserMemory() {
                         {filteredEventLogs.length > 0 ? (
                             filteredEventLogs.map(log => {
                                 const parent = log.parent_episode_id ? episodesById.get(log.parent_episode_id) : undefined;
-                                const source = extractSource(parent?.metadata);
+                                const source = parent ? episodeSourcesById.get(parent.id) ?? null : null;
                                 return (
                                     <div
                                         key={log.id}
@@ -1846,7 +1848,7 @@ export function UserMemory() {
                         {filteredForesights.length > 0 ? (
                             filteredForesights.map(fs => {
                                 const parent = fs.parent_episode_id ? episodesById.get(fs.parent_episode_id) : undefined;
-                                const source = extractSource(parent?.metadata);
+                                const source = parent ? episodeSourcesById.get(parent.id) ?? null : null;
                                 return (
                                     <div
                                         key={fs.id}
@@ -168,6 +168,8 @@ export function RightPanel({
     }, [selectedChunkId, activeChunk]);
 
     const fileId = file?.id ?? null;
+    // Keys the main-process page cache, so pages of an edited file are re-rendered
+    const fileVersion = file?.modifiedAt;
     const _activeChunkId = activeChunk?.chunk_id ?? null;
 
     const loadChunks = useCallback(
@@ -324,17 +326,15 @@ export function RightPanel({
         );
     }, [selectedHit, activeChunk]);
 
+    // Resolve each chunk's page once per chunk list; the memos below and every
+    // page turn reuse it instead of re-walking the metadata shapes.
+    const chunkPages = useMemo(() => chunks.map((c) => resolvePageNumber(c.metadata)), [chunks]);
+
     const pageChunks = useMemo(() => {
         if (!isPdf) return [];
-        return chunks.filter((c, index) => {
-            let p = resolvePageNumber(c.metadata);
-            if (p === null && index === 0) p = 1;
-            // If we still don't have a page number, maybe group it with page 1 or handle it?
-            // For now, let's match the grouping logic which defaults to 1 if null
-            if (p === null) p = 1;
-            return p === pageNumber;
-        });
-    }, [chunks, isPdf, pageNumber]);
+        // Chunks without a page number are grouped with page 1
+        return chunks.filter((_c, index) => (chunkPages[index] ?? 1) === pageNumber);
+    }, [chunks, chunkPages, isPdf, pageNumber]);
 
     const pageText = useMemo(() => {
         if (!isPdf) return null;
@@ -342,23 +342,27 @@ export function RightPanel({
     }, [pageChunks, isPdf]);
 
     const totalPages = useMemo(() => {
-        if (!isPdf || chunks.length === 0) return 0;
+        if (!isPdf || chunkPages.length === 0) return 0;
         let max = 0;
-        for (const c of chunks) {
-            const p = resolvePageNumber(c.metadata);
+        for (const p of chunkPages) {
             if (p && p > max) max = p;
         }
         return max;
-    }, [chunks, isPdf]);
+    }, [chunkPages, isPdf]);
+
+    // Read by the page-image loader when it prefetches neighbours, without making
+    // the page load itself depend on the page count
+    const totalPagesRef = useRef(totalPages);
+    useEffect(() => {
+        totalPagesRef.current = totalPages;
+    }, [totalPages]);
 
     const pageGroups = useMemo(() => {
         const groups = new Map<number, { page: number; firstChunkId: string; count: number; startIdx: number; endIdx: number }>();
         
         chunks.forEach((chunk, index) => {
-            // If page number is missing for the first chunk of a PDF, assume it's page 1
-            let page = resolvePageNumber(chunk.metadata);
-            if (page === null && index === 0 && isPdf) page = 1;
-            if (page === null) page = 1; // Fallback for grouping
+            // If page number is missing, assume it's page 1 (fallback for grouping)
+            const page = chunkPages[index] ?? 1;
 
             if (!groups.has(page)) {
                 groups.set(page, { 
@@ -375,7 +379,7 @@ export function RightPanel({
         });
         
         return Array.from(groups.values()).sort((a, b) => a.page - b.page);
-    }, [chunks, isPdf]);
+    }, [chunks, chunkPages]);
 
     const handlePageChange = (delta: number) => {
         const newPage = pageNumber + delta;
@@ -433,9 +437,13 @@ export function RightPanel({
         };
     }, [file, isImage]);
 
+    // The page image is only shown on the preview tab; don't ask the backend to
+    // rasterize pages nobody is looking at.
+    const showsPdfPreview = activeTab === 'preview' && hasPreview;
+
     // Load PDF page image for region zoom preview
     useEffect(() => {
-        if (!file || !isPdf || !fileId || !window.api?.getPdfPageImage) {
+        if (!file || !isPdf || !fileId || !showsPdfPreview || !window.api?.getPdfPageImage) {
             setPdfPageImage(null);
             return;
         }
@@ -445,10 +453,20 @@ export function RightPanel({
         setPdfViewBox(null);
         setSelectionRect(null);
 
-        window.api.getPdfPageImage(fileId, pageNumber, 2.0)
+        window.api.getPdfPageImage(fileId, pageNumber, 2.0, fileVersion)
             .then((data) => {
                 if (active) {
                     setPdfPageImage(`data:image/png;base64,${data}`);
+                    // Once this page has arrived, warm its neighbours in the
+                    // main-process cache so paging back and forth is instant.
+                    const prefetch = window.api?.prefetchPdfPage;
+                    if (prefetch) {
+                        for (const neighbour of [pageNumber + 1, pageNumber - 1]) {
+                            if (neighbour >= 1 && neighbour <= totalPagesRef.current) {
+                                prefetch(fileId, neighbour, 2.0, fileVersion).catch(() => undefined);
+                            }
+                        }
+                    }
                 }
             })
             .catch((err) => {
@@ -462,7 +480,7 @@ export function RightPanel({
         return () => {
             active = false;
         };
-    }, [file, isPdf, fileId, pageNumber]);
+    }, [file, isPdf, fileId, fileVersion, pageNumber, showsPdfPreview]);
 
 
     // Reset viewBox when page changes
@@ -13,6 +13,19 @@ interface AgentContextState {
 
 const LOCAL_MODEL_LABEL = 'local-llm';
 
+// Map a snake_case hit from the QA stream to the client shape. Each raw hit is
+// normalized once; sub-query results derive their global copies from it.
+function mapStreamHit(hit: any): SearchHit {
+    return {
+        fileId: hit.file_id || hit.fileId || '',
+        score: hit.score || 0,
+        summary: hit.summary || null,
+        snippet: hit.snippet || null,
+        metadata: hit.metadata || {},
+        chunkId: hit.chunk_id || hit.chunkId || null,
+    };
+}
+
 export function useChatSession() {
     const { config } = useModelConfig();
     const [sessions, setSessions] = useState<ChatSession[]>([]);
@@ -401,6 +414,10 @@ Title:`;
                     // Keep the last incomplete line in the buffer
                     buffer = lines.pop() || '';
 
+                    // Tokens arriving in the same chunk are coalesced into a single
+                    // render instead of one session-array copy per token.
+                    let hasPendingText = false;
+
                     // Process complete lines
                     for (const line of lines) {
                         if (!line.trim()) continue;
@@ -507,7 +524,7 @@ Title:`;
                                             isComplete: false
                                         }
                                     });
-                                    return; // Early return since we already updated
+                                    continue; // Already updated; move on to the next line
                                 }
 
                                 // Handle "searching_subquery_1_of_2" pattern
@@ -518,16 +535,7 @@ Title:`;
                                 currentMeta = statusText;
                                 updateMessage({ meta: currentMeta });
                             } else if (payload.type === 'hits') {
-                                // Map snake_case to camelCase for hits from streaming
-                                const mapHit = (h: any) => ({
-                                    fileId: h.file_id || h.fileId || '',
-                                    score: h.score || 0,
-                                    summary: h.summary || null,
-                                    snippet: h.snippet || null,
-                                    metadata: h.metadata || {},
-                                    chunkId: h.chunk_id || h.chunkId || null,
-                                });
-                                const newHits = (payload.data || []).map(mapHit);
+                                const newHits = (payload.data || []).map(mapStreamHit);
                                 const previousHitsCount = currentHits.length;
 
                                 // CRITICAL: Always update thinkingSteps search step with hits
@@ -580,14 +588,7 @@ Title:`;
                                 const subQueryIndex = subqueryData.sub_query_index;
 
                                 // Map snake_case to camelCase and add sub-query info
-                                const enrichedHits: ThinkingStepHit[] = rawHits.map((hit: any) => ({
-                                    fileId: hit.file_id || hit.fileId || '',
-                                    score: hit.score || 0,
-                                    summary: hit.summary || null,
-                                    snippet: hit.snippet || null,
-                                    metadata: hit.metadata || {},
-                                    chunkId: hit.chunk_id || hit.chunkId || null,
-                                }));
+                                const enrichedHits: SearchHit[] = rawHits.map(mapStreamHit);
 
                                 // Find the search step for this sub-query and attach hits
                                 const searchStepIdx = currentThinkingSteps.findIndex(s =>
@@ -603,13 +604,8 @@ Title:`;
                                 }
 
                                 // Also update global hits for backward compatibility
-                                const globalHits = rawHits.map((hit: any) => ({
-                                    fileId: hit.file_id || hit.fileId || '',
-                                    score: hit.score || 0,
-                                    summary: hit.summary || null,
-                                    snippet: hit.snippet || null,
-                                    metadata: hit.metadata || {},
-                                    chunkId: hit.chunk_id || hit.chunkId || null,
+                                const globalHits = enrichedHits.map((hit) => ({
+                                    ...hit,
                                     subQueryIndex: subqueryData.sub_query_index,
                                     subQuery: subqueryData.sub_query,
                                 }));
@@ -856,7 +852,7 @@ Title:`;
                                 }
                             } else if (payload.type === 'token') {
                                 currentAnswer += payload.data;
-                                updateMessage({ text: currentAnswer });
+                                hasPendingText = true;
                             } else if (payload.type === 'error') {
                                 maybeNotifyContextTooLarge(payload.data);
                                 currentAnswer += `\n[Error: ${payload.data}]`;
@@ -882,6 +878,10 @@ Title:`;
                             console.error('Failed to parse stream line', e, 'Line:', line);
                         }
                     }
+
+                    if (hasPendingText) {
+                        updateMessage({ text: currentAnswer });
+                    }
                 },
                 onError: (error) => {
                     if (askSessionRef.current !== requestId) return;
@@ -1029,6 +1029,7 @@ Title:`;
                     const lines = buffer.split('\n');
                     buffer = lines.pop() || '';
 
+                    let hasPendingText = false;
                     for (const line of lines) {
                         if (!line.trim()) continue;
                         try {
@@ -1107,22 +1108,14 @@ Title:`;
                                             isPreparing: true, isComplete: false
                                         }
                                     });
-                                    return;
+                                    continue;
                                 }
                                 const subqueryMatch = payload.data?.match(/searching_subquery_(\d+)_of_(\d+)/);
                                 if (subqueryMatch) statusText = `Searching sub-query ${subqueryMatch[1]}/${subqueryMatch[2]}...`;
                                 currentMeta = statusText;
                                 updateMessage({ meta: currentMeta });
                             } else if (payload.type === 'hits') {
-                                const mapHit = (h: any) => ({
-                                    fileId: h.file_id || h.fileId || '',
-                                    score: h.score || 0,
-                                    summary: h.summary || null,
-                                    snippet: h.snippet || null,
-                                    metadata: h.metadata || {},
-                                    chunkId: h.chunk_id || h.chunkId || null,
-                                });
-                                const newHits = (payload.data || []).map(mapHit);
+                                const newHits = (payload.data || []).map(mapStreamHit);
                                 const previousHitsCount = currentHits.length;
                                 if (isMultiPath && previousHitsCount > 0) {
                                     const existingChunkIds = new Set(currentHits.map(h => h.chunkId || h.fileId));
@@ -1141,14 +1134,7 @@ Title:`;
                                 const subqueryData = payload.data;
                                 const rawHits = subqueryData.hits || [];
                                 const subQueryIndex = subqueryData.sub_query_index;
-                                const enrichedHits: ThinkingStepHit[] = rawHits.map((hit: any) => ({
-                                    fileId: hit.file_id || hit.fileId || '',
-                                    score: hit.score || 0,
-                                    summary: hit.summary || null,
-                                    snippet: hit.snippet || null,
-                                    metadata: hit.metadata || {},
-                                    chunkId: hit.chunk_id || hit.chunkId || null,
-                                }));
+                                const enrichedHits: SearchHit[] = rawHits.map(mapStreamHit);
                                 const searchStepIdx = currentThinkingSteps.findIndex(s => s.type === 'search' && s.metadata?.subQueryIndex === subQueryIndex);
                                 if (searchStepIdx >= 0) {
                                     currentThinkingSteps[searchStepIdx] = {
@@ -1158,16 +1144,11 @@ Title:`;
                                     };
                                     updateMessage({ thinkingSteps: [...currentThinkingSteps] });
                                 }
-                                const globalHits = rawHits.map((hit: any) => ({
-                                    fileId: hit.file_id || hit.fileId || '',
-                                    score: hit.score || 0,
-                                    summary: hit.summary || null,
-                                    snippet: hit.snippet || null,
-                                    metadata: hit.metadata || {},
-                                    chunkId: hit.chunk_id || hit.chunkId || null,
+                                const globalHits = enrichedHits.map((hit) => ({
+                                    ...hit,
                                     subQueryIndex: subqueryData.sub_query_index,
                                     subQuery: subqueryData.sub_query,
-                                })) as SearchHit[];
+                                }));
                                 currentHits = [...currentHits, ...globalHits];
                                 updateMessage({ references: currentHits, meta: `Sub-query ${subqueryData.sub_query_index}: Found ${enrichedHits.length} sources` });
                             } else if (payload.type === 'chunk_progress') {
@@ -1220,7 +1201,7 @@ Title:`;
                                 }
                             } else if (payload.type === 'token') {
                                 currentAnswer += payload.data;
-                                updateMessage({ text: currentAnswer });
+                                hasPendingText = true;
                             } else if (payload.type === 'error') {
                                 maybeNotifyContextTooLarge(payload.data);
                                 currentAnswer += `\n[Error: ${payload.data}]`;
@@ -1242,6 +1223,10 @@ Title:`;
                             console.error('Failed to parse stream line', e, 'Line:', line);
                         }
                     }
+
+                    if (hasPendingText) {
+                        updateMessage({ text: currentAnswer });
+                    }
                 },
                 onError: (error) => {
                     if (askSessionRef.current !== requestId) return;
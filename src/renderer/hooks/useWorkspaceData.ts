@@ -29,16 +29,24 @@ const KIND_DEFAULT_COUNTS: Record<FileKind, number> = {
     other: 0
 };
 
+// Extension -> kind lookup, built once rather than allocating the
+// extension lists on every inferKind call
+const KIND_BY_EXTENSION: ReadonlyMap<string, IndexedFile['kind']> = new Map(
+    ([
+        ['document', ['pdf', 'doc', 'docx', 'txt', 'md', 'rtf']],
+        ['image', ['png', 'jpg', 'jpeg', 'gif', 'svg', 'bmp', 'webp']],
+        ['presentation', ['ppt', 'pptx', 'key']],
+        ['spreadsheet', ['xls', 'xlsx', 'csv', 'ods']],
+        ['audio', ['mp3', 'wav', 'aac', 'flac']],
+        ['video', ['mp4', 'mov', 'avi', 'mkv', 'webm']],
+        ['archive', ['zip', 'rar', 'tar', 'gz', '7z']],
+    ] as Array<[IndexedFile['kind'], string[]]>).flatMap(([kind, extensions]) =>
+        extensions.map((ext): [string, IndexedFile['kind']] => [ext, kind])
+    )
+);
+
 function inferKind(extension: string): IndexedFile['kind'] {
-    const ext = extension.toLowerCase();
-    if (['pdf', 'doc', 'docx', 'txt', 'md', 'rtf'].includes(ext)) return 'document';
-    if (['png', 'jpg', 'jpeg', 'gif', 'svg', 'bmp', 'webp'].includes(ext)) return 'image';
-    if (['ppt', 'pptx', 'key'].includes(ext)) return 'presentation';
-    if (['xls', 'xlsx', 'csv', 'ods'].includes(ext)) return 'spreadsheet';
-    if (['mp3', 'wav', 'aac', 'flac'].includes(ext)) return 'audio';
-    if (['mp4', 'mov', 'avi', 'mkv', 'webm'].includes(ext)) return 'video';
-    if (['zip', 'rar', 'tar', 'gz', '7z'].includes(ext)) return 'archive';
-    return 'other';
+    return KIND_BY_EXTENSION.get(extension.toLowerCase()) ?? 'other';
 }
 
 function deriveDefaultLabel(pathValue: string): string {
@@ -53,9 +61,9 @@ function deriveFolderLabel(folder: FolderRecord): string {
     return `Folder ${folder.id}`;
 }
 
-function mapIndexedFile(record: FileRecord, folderMap: Map<string, FolderRecord>): IndexedFile {
-    const folder = folderMap.get(record.folderId);
-    const location = folder ? deriveFolderLabel(folder) : 'Unknown';
+// folderLabels maps folder id -> display label, derived once per refresh rather than per file
+function mapIndexedFile(record: FileRecord, folderLabels: Map<string, string>): IndexedFile {
+    const location = folderLabels.get(record.folderId) ?? 'Unknown';
     const fullPath = record.path || record.name;
 
     // Ensure kind is set
@@ -175,6 +183,12 @@ export function useWorkspaceData() {
         }
 
         try {
+            // System specs come from the main process, not the backend, so fetch them
+            // while the health check is in flight rather than after it
+            const specsPromise: Promise<SystemSpecs | null> = (api as any).getSystemSpecs
+                ? (api as any).getSystemSpecs().catch(() => null)
+                : Promise.resolve(null);
+
             // First check if backend is reachable via health check
             console.log('[useWorkspaceData] Calling health check...');
             const healthData = await api.health();
@@ -256,7 +270,7 @@ export function useWorkspaceData() {
                     ? Promise.resolve({ files: files, progress, indexing: [] }) // Return cached data
                     : api.indexInventory(INVENTORY_LIMIT ? { limit: INVENTORY_LIMIT } : {}),
                 api.listEmailAccounts?.() ?? Promise.resolve([]),
-                (api as any).getSystemSpecs ? (api as any).getSystemSpecs() : Promise.resolve(null),
+                specsPromise,
                 (api as any).stageProgress ? (api as any).stageProgress() : Promise.resolve(null)
             ]);
 
@@ -272,8 +286,8 @@ export function useWorkspaceData() {
             const foundNotesFolder = folderData.find((folder: FolderRecord) => normalisePath(folder.path).includes('/.synvo_db/notes'));
             setNoteFolderId(foundNotesFolder ? foundNotesFolder.id : null);
 
-            const folderMap = new Map<string, FolderRecord>(folderData.map((folder: FolderRecord) => [folder.id, folder]));
-            const indexedFiles = inventoryData.files.map((record: FileRecord) => mapIndexedFile(record, folderMap));
+            const folderLabels = new Map<string, string>(folderData.map((folder: FolderRecord) => [folder.id, deriveFolderLabel(folder)]));
+            const indexedFiles = inventoryData.files.map((record: FileRecord) => mapIndexedFile(record, folderLabels));
             setFiles(indexedFiles);
 
             const resolvedEmailAccounts = Array.isArray(emailData)
@@ -4,3 +4,14 @@ import { twMerge } from "tailwind-merge";
 export function cn(...inputs: ClassValue[]) {
     return twMerge(clsx(inputs));
 }
+
+// Build a formatter once and reuse it: toLocale*String with options creates a new
+// Intl.DateTimeFormat on every call. Unlike toLocale*String, format() throws on an
+// invalid Date, so unparseable input falls back to the same 'Invalid Date' text.
+export function createDateFormatter(options: Intl.DateTimeFormatOptions): (value: Date | string | number) => string {
+    const formatter = new Intl.DateTimeFormat(undefined, options);
+    return (value) => {
+        const date = value instanceof Date ? value : new Date(value);
+        return Number.isNaN(date.getTime()) ? "Invalid Date" : formatter.format(date);
+    };
+}